@@ -0,0 +1,264 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from array import array
+
+from .cpu import CPUScheduler, ProcessTable
+from .memory import MemoryManager, TraceFile
+from .smp import SMPScheduler
+
+# Headless batch runner: python -m algorithms {cpu,memory} ALGORITHM... -i FILE... runs every
+# algorithm over every file, spread over worker processes, and writes one result row per
+# (file, algorithm) as JSON Lines, CSV or Parquet. Nothing here imports Streamlit or Plotly.
+
+CPU_ALGORITHMS = tuple(CPUScheduler._kernels)
+MEMORY_ALGORITHMS = ("fifo", "lru", "opt", "clock", "lfu", "arc", "two_q", "pff")
+SMP_ALGORITHMS = ("fcfs", "sjf_non_preemptive", "round_robin")
+FORMATS = ("jsonl", "csv", "parquet")
+
+
+def read_processes(path):
+    # CSV (read with the csv module) or, when pyarrow is installed, Parquet and Arrow/Feather
+    # files with the same pid, arrival, burst and optional priority columns as the app.
+    if path.lower().endswith((".parquet", ".arrow", ".feather")):
+        return _read_columnar(path)
+    columns = {}
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = [c.strip().lower() for c in next(reader, [])]
+        _check_columns(header)
+        index = {name: header.index(name) for name in ("pid", "arrival", "burst", "priority") if name in header}
+        for name in index:
+            columns[name] = []
+        for line, row in enumerate(reader, 2):
+            if not row:
+                continue
+            for name, k in index.items():
+                try:
+                    columns[name].append(_whole(row[k]))
+                except (IndexError, ValueError):
+                    raise ValueError(f"line {line}: column {name} must hold whole numbers") from None
+    _check_values(columns["arrival"], columns["burst"])
+    return ProcessTable(columns["pid"], columns["arrival"], columns["burst"], columns.get("priority"))
+
+
+def _read_columnar(path):
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("reading Parquet or Arrow workloads needs pyarrow") from None
+    table = pq.read_table(path) if path.lower().endswith(".parquet") else feather.read_table(path)
+    table = table.rename_columns([str(c).strip().lower() for c in table.column_names])
+    _check_columns(table.column_names)
+    columns = {}
+    for name in ("pid", "arrival", "burst", "priority"):
+        if name not in table.column_names:
+            continue
+        col = table.column(name)
+        if col.null_count:
+            raise ValueError(f"column {name} has missing values")
+        try:
+            col = pc.cast(col, pa.int64())
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            raise ValueError(f"column {name} must hold whole numbers") from None
+        columns[name] = col.to_numpy()
+    _check_values(columns["arrival"], columns["burst"])
+    return ProcessTable.from_buffers(columns["pid"], columns["arrival"], columns["burst"], columns.get("priority"))
+
+
+def _check_columns(names):
+    missing = [c for c in ("pid", "arrival", "burst") if c not in names]
+    if missing:
+        raise ValueError(f"missing column(s) {', '.join(missing)}")
+
+
+def _check_values(arrival, burst):
+    if (len(arrival) and min(arrival) < 0) or (len(burst) and min(burst) < 1):
+        raise ValueError("arrival must be non-negative and burst positive")
+
+
+def _whole(text):
+    try:
+        return int(text)
+    except ValueError:
+        value = float(text)
+        if not value.is_integer():
+            raise
+        return int(value)
+
+
+def run_cpu(path, algorithm, params):
+    table = read_processes(path)
+    cores = params["cores"]
+    if cores > 1:
+        quantum = params["quantum"] if algorithm == "round_robin" else None
+        result, (_, pids, _, _), stats = SMPScheduler(cores, params["balance"]).run(algorithm, table, quantum)
+    else:
+        kwargs = {}
+        if algorithm == "round_robin":
+            kwargs = {"quantum": params["quantum"], "merge": True}
+        elif algorithm == "srtf":
+            kwargs = {"merge": True}
+        elif algorithm == "mlfq":
+            kwargs = {"quanta": params["quanta"], "boost": params["boost"], "merge": True}
+        result, (pids, _, _) = CPUScheduler().run_compact(algorithm, table, **kwargs)
+        stats = None
+
+    n = len(result)
+    makespan = max(result.completion_time) if n else 0
+    switches = sum(1 for a, b in zip(pids, pids[1:]) if a != b) if cores == 1 else None
+    row = {
+        "file": path,
+        "algorithm": algorithm,
+        "processes": n,
+        "avg_waiting": sum(result.waiting_time) / n if n else 0,
+        "avg_turnaround": sum(result.turnaround_time) / n if n else 0,
+        "throughput": n / makespan if makespan else 0,
+        "makespan": makespan,
+        "context_switches": switches,
+    }
+    if stats is not None:
+        row["migrations"] = stats["Migrations"]
+        row["steals"] = stats["Steals"]
+        row["utilisation"] = sum(stats["Utilisation"]) / cores
+    return row
+
+
+def run_memory(path, algorithm, params):
+    manager = MemoryManager()
+    with TraceFile(path, params["trace_format"]) as pages:
+        row = {"file": path, "algorithm": algorithm, "references": len(pages)}
+        if algorithm == "pff":
+            allocation = array("q")
+            faults, _ = manager.pff(pages, params["threshold"], snapshots=False, allocation=allocation)
+            row["threshold"] = params["threshold"]
+            row["avg_frames"] = sum(allocation) / len(allocation) if allocation else 0
+            row["max_frames"] = max(allocation, default=0)
+        else:
+            faults, _ = getattr(manager, algorithm)(pages, params["frames"], snapshots=False)
+            row["frames"] = params["frames"]
+    total = row["references"]
+    row["faults"] = faults
+    row["hits"] = total - faults
+    row["fault_rate"] = faults / total if total else 0
+    return row
+
+
+def run_task(task):
+    # One (file, algorithm) simulation; runs in a worker process, so it reports failures
+    # as a value instead of raising and aborting the whole batch.
+    module, path, algorithm, params = task
+    try:
+        run = run_cpu if module == "cpu" else run_memory
+        return run(path, algorithm, params), None
+    except (OSError, ValueError) as e:
+        return None, f"{path} ({algorithm}): {e}"
+
+
+def write_rows(rows, fmt, output):
+    if fmt == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Parquet output needs pyarrow") from None
+        if output == "-":
+            raise ValueError("Parquet output needs --output")
+        pq.write_table(pa.Table.from_pylist(rows), output)
+        return
+    f = sys.stdout if output == "-" else open(output, "w", newline="")
+    try:
+        if fmt == "jsonl":
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+        else:
+            # Rows of different algorithms can carry different fields (e.g. PFF's threshold).
+            fields = list(dict.fromkeys(key for row in rows for key in row))
+            writer = csv.DictWriter(f, fields)
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+
+def _positive(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m algorithms",
+                                     description="Run CPU scheduling or page replacement simulations over workload files.")
+    sub = parser.add_subparsers(dest="module", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-i", "--input", nargs="+", required=True, metavar="FILE", help="workload files")
+    common.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    common.add_argument("-f", "--format", choices=FORMATS,
+                        help="output format (default: from the output file extension, else jsonl)")
+    common.add_argument("-j", "--workers", type=_positive, default=os.cpu_count() or 1,
+                        help="worker processes (default: one per CPU)")
+
+    cpu = sub.add_parser("cpu", parents=[common], help="CPU scheduling over CSV, Parquet or Arrow workloads")
+    cpu.add_argument("algorithm", nargs="+", choices=CPU_ALGORITHMS)
+    cpu.add_argument("--quantum", type=_positive, default=2, help="Round Robin time quantum")
+    cpu.add_argument("--quanta", type=_positive, nargs="+", default=[2, 4, 8], help="MLFQ quantum per level")
+    cpu.add_argument("--boost", type=_positive, help="MLFQ priority boost period")
+    cpu.add_argument("--cores", type=_positive, default=1, help="simulate a multi-core machine")
+    cpu.add_argument("--balance", choices=SMPScheduler.policies, default="global",
+                     help="load balancing with more than one core")
+
+    memory = sub.add_parser("memory", parents=[common], help="page replacement over reference traces")
+    memory.add_argument("algorithm", nargs="+", choices=MEMORY_ALGORITHMS)
+    memory.add_argument("--frames", type=_positive, default=3, help="number of frames")
+    memory.add_argument("--threshold", type=_positive, default=10, help="PFF fault-gap threshold")
+    memory.add_argument("--trace-format", choices=tuple(TraceFile.formats), default="text",
+                        help="text (whitespace or comma separated) or raw native-endian int32/int64")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    params = vars(args).copy()
+    if args.module == "cpu" and args.cores > 1:
+        unsupported = [a for a in args.algorithm if a not in SMP_ALGORITHMS]
+        if unsupported:
+            parser.error(f"--cores only supports {', '.join(SMP_ALGORITHMS)}")
+    fmt = args.format
+    if fmt is None:
+        ext = os.path.splitext(args.output)[1].lstrip(".").lower()
+        fmt = {"json": "jsonl", "ndjson": "jsonl"}.get(ext, ext if ext in FORMATS else "jsonl")
+
+    tasks = [(args.module, path, algorithm, params) for path in args.input for algorithm in args.algorithm]
+    workers = min(args.workers, len(tasks))
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as pool:
+            outcomes = list(pool.map(run_task, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+    else:
+        outcomes = [run_task(task) for task in tasks]
+
+    rows = [row for row, _ in outcomes if row is not None]
+    errors = [error for _, error in outcomes if error is not None]
+    for error in errors:
+        print(f"error: {error}", file=sys.stderr)
+    try:
+        write_rows(rows, fmt, args.output)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import hashlib
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+
+class ResultCache:
+    # Content-addressed store of simulation results. A key hashes the algorithm name, its
+    # parameters and the contents of the workload, so equal simulations share one entry
+    # whoever runs them. The least recently used results are dropped once more than
+    # max_entries are held or their approximate size passes max_bytes; a result bigger than
+    # max_bytes is returned without being stored. Lookups are locked, so one instance can
+    # serve several threads (e.g. every Streamlit session); results are shared, not copied,
+    # and must be treated as read-only.
+    def __init__(self, max_entries=32, max_bytes=None):
+        if max_entries < 1 or (max_bytes is not None and max_bytes < 1):
+            raise ValueError("max_entries and max_bytes must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @staticmethod
+    def fingerprint(*parts):
+        # Digest of workload parts. A part is a buffer (bytes, array, memoryview, NumPy
+        # array), a list of ints, or anything with chunks() yielding buffers (a TraceFile).
+        # Element type and item count are hashed with the bytes, so one file read as int32
+        # and as int64 gives two different digests.
+        digest = hashlib.blake2b(digest_size=20)
+        for part in parts:
+            sub = hashlib.blake2b(digest_size=20)
+            items = 0
+            last_kind = None
+            for chunk in part.chunks() if hasattr(part, "chunks") else (part,):
+                if isinstance(chunk, (list, tuple, range)):
+                    chunk = array("q", chunk)
+                view = memoryview(chunk)
+                fmt = view.format.lstrip("@=<>!")
+                # "l" and "q" are both int64 on most platforms; name types by kind and width.
+                kind = f"{'i' if fmt in 'bhilqn' else 'u' if fmt in 'BHILQN' else fmt}{view.itemsize}"
+                if kind != last_kind:
+                    sub.update(f"[{kind}]".encode())
+                    last_kind = kind
+                items += view.nbytes // view.itemsize
+                sub.update(view)
+            sub.update(f"[{items}]".encode())
+            digest.update(sub.digest())
+        return digest.digest()
+
+    @classmethod
+    def key(cls, algorithm, params, *parts):
+        digest = hashlib.blake2b(repr((algorithm, sorted(params.items()))).encode(), digest_size=20)
+        digest.update(cls.fingerprint(*parts))
+        return digest.hexdigest()
+
+    @staticmethod
+    def sizeof(value):
+        # Approximate memory held by a result: buffers by their byte size, containers and
+        # plain objects (ProcessTable, PageTrace, ...) by their contents, each object once.
+        seen = set()
+        total = 0
+        stack = [value]
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            if isinstance(obj, memoryview) or hasattr(obj, "__array_interface__"):
+                total += obj.nbytes
+                continue
+            total += sys.getsizeof(obj)
+            if isinstance(obj, (str, bytes, bytearray, array, int, float)):
+                continue
+            if isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                stack.extend(obj)
+            elif hasattr(obj, "__dict__"):
+                stack.extend(vars(obj).values())
+        return total
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        # Computed and measured outside the lock so a long simulation does not block other lookups.
+        value = compute()
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return value
+        with self._lock:
+            self.bytes += size - self._sizes.get(key, 0)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries or (self.max_bytes is not None and self.bytes > self.max_bytes):
+                old, _ = self._entries.popitem(last=False)
+                self.bytes -= self._sizes.pop(old)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.bytes = 0
@@ -1,6 +1,12 @@
-import pandas as pd
+import heapq
+import os
+from array import array
+from collections import deque
 
 class Process:
+    __slots__ = ("pid", "arrival_time", "burst_time", "priority", "remaining_time",
+                 "start_time", "completion_time", "waiting_time", "turnaround_time")
+
     def __init__(self, pid, arrival_time, burst_time, priority=0):
         self.pid = pid
         self.arrival_time = arrival_time
@@ -12,95 +18,533 @@ class Process:
         self.waiting_time = 0
         self.turnaround_time = 0
 
+class ProcessTable:
+    # Struct-of-arrays workload: one int64 column per Process attribute.
+    columns = ("pid", "arrival_time", "burst_time", "priority",
+               "start_time", "completion_time", "waiting_time", "turnaround_time")
+
+    def __init__(self, pid=(), arrival_time=(), burst_time=(), priority=None):
+        self.pid = array("q", pid)
+        self.arrival_time = array("q", arrival_time)
+        self.burst_time = array("q", burst_time)
+        n = len(self.pid)
+        if len(self.arrival_time) != n or len(self.burst_time) != n:
+            raise ValueError("pid, arrival_time and burst_time must have the same length")
+        self.priority = array("q", priority) if priority is not None else array("q", bytes(8 * n))
+        self.start_time = array("q", [-1]) * n
+        self.completion_time = array("q", bytes(8 * n))
+        self.waiting_time = array("q", bytes(8 * n))
+        self.turnaround_time = array("q", bytes(8 * n))
+
+    @classmethod
+    def from_processes(cls, processes):
+        return cls([p.pid for p in processes], [p.arrival_time for p in processes],
+                   [p.burst_time for p in processes], [p.priority for p in processes])
+
+    @classmethod
+    def from_records(cls, records):
+        return cls([r["pid"] for r in records], [r["arrival"] for r in records],
+                   [r["burst"] for r in records], [r.get("priority", 0) for r in records])
+
+    @classmethod
+    def from_buffers(cls, pid, arrival_time, burst_time, priority=None):
+        # Bulk copy of int64 buffers (e.g. NumPy columns), with no Python int per element when
+        # they are contiguous; strided views are copied element by element.
+        columns = []
+        for buf in (pid, arrival_time, burst_time, priority):
+            col = array("q")
+            if buf is not None:
+                view = memoryview(buf)
+                if view.ndim != 1 or view.itemsize != col.itemsize or view.format.lstrip("@=") not in ("q", "l"):
+                    raise ValueError(f"columns must be one-dimensional 64-bit integers, got format {view.format!r}")
+                if view.contiguous:
+                    col.frombytes(view.cast("B"))
+                else:
+                    col.fromlist(view.tolist())
+            columns.append(col)
+        return cls(*columns[:3], columns[3] if priority is not None else None)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, i):
+        p = Process(self.pid[i], self.arrival_time[i], self.burst_time[i], self.priority[i])
+        p.start_time = self.start_time[i]
+        p.completion_time = self.completion_time[i]
+        p.waiting_time = self.waiting_time[i]
+        p.turnaround_time = self.turnaround_time[i]
+        return p
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def take(self, order):
+        table = ProcessTable.__new__(ProcessTable)
+        for name in self.columns:
+            col = getattr(self, name)
+            setattr(table, name, array("q", [col[i] for i in order]))
+        return table
+
+    def concat(self, other):
+        table = ProcessTable.__new__(ProcessTable)
+        for name in self.columns:
+            setattr(table, name, getattr(self, name) + getattr(other, name))
+        return table
+
+    def sorted_by_arrival(self):
+        order = sorted(range(len(self)), key=self.arrival_time.__getitem__)
+        return self.take(order)
+
 class CPUScheduler:
     def fcfs(self, processes):
-        processes.sort(key=lambda x: x.arrival_time)
-        current_time = 0
-        timeline = [] 
-
-        for p in processes:
-            if current_time < p.arrival_time:
-                current_time = p.arrival_time
-            
-            p.start_time = current_time
-            p.completion_time = current_time + p.burst_time
-            p.turnaround_time = p.completion_time - p.arrival_time
-            p.waiting_time = p.start_time - p.arrival_time
-            
-            timeline.append(dict(Task=f"P{p.pid}", Start=p.start_time, Finish=p.completion_time, Resource=f"Process {p.pid}"))
-            current_time = p.completion_time
-            
-        return processes, timeline
+        return self._collect("fcfs", processes)
+
+    def fcfs_vectorized(self, processes):
+        # Closed form of FCFS: completion[i] = S[i] + max(0, max_{j<=i}(arrival[j] - S[j-1])),
+        # where S is the running sum of bursts in arrival order. Like the other methods, a
+        # ProcessTable gives a new table and a list of Process is sorted and filled in place;
+        # the timeline comes back as NumPy (pid, start, finish) columns.
+        import numpy as np
+
+        if isinstance(processes, ProcessTable):
+            table, procs = processes, None
+        else:
+            table, procs = self._prepare(processes)
+        order = np.argsort(np.frombuffer(table.arrival_time, dtype=np.int64), kind="stable")
+        cols = {name: np.frombuffer(getattr(table, name), dtype=np.int64)[order] for name in ProcessTable.columns}
+        arrival, burst = cols["arrival_time"], cols["burst_time"]
+
+        ends = np.cumsum(burst)
+        offset = np.maximum.accumulate(arrival - (ends - burst))
+        np.maximum(offset, 0, out=offset)
+        completion = ends + offset
+        start = completion - burst
+
+        cols["start_time"] = start
+        cols["completion_time"] = completion
+        cols["turnaround_time"] = completion - arrival
+        cols["waiting_time"] = start - arrival
+
+        result = ProcessTable.__new__(ProcessTable)
+        for name, col in cols.items():
+            setattr(result, name, array("q", col.tobytes()))
+        if procs is not None:
+            result = self._finish(result, procs, range(len(procs)))
+        return result, (cols["pid"], start, completion)
 
     def sjf_non_preemptive(self, processes):
-        processes.sort(key=lambda x: x.arrival_time)
-        completed = []
+        return self._collect("sjf_non_preemptive", processes)
+
+    def round_robin(self, processes, quantum, merge=False):
+        return self._collect("round_robin", processes, quantum=quantum, merge=merge)
+
+    def srtf(self, processes, merge=False):
+        return self._collect("srtf", processes, merge=merge)
+
+    def mlfq(self, processes, quanta=(2, 4, 8), boost=None, merge=False):
+        return self._collect("mlfq", processes, quanta=quanta, boost=boost, merge=merge)
+
+    def round_robin_sweep(self, processes, quanta, max_workers=None):
+        table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+        quanta = list(quanta)
+        workers = min(max_workers or os.cpu_count() or 1, len(quanta))
+        if workers <= 1:
+            return [_rr_sweep_point(table, q) for q in quanta]
+        # Imported here: concurrent.futures.process pulls in multiprocessing, most of this
+        # module's import time, and only the sweep needs it.
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Each worker unpickles its own copy of the workload once, then runs its share of quanta.
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker, initargs=(table,)) as pool:
+            return list(pool.map(_rr_sweep_point, [None] * len(quanta), quanta))
+
+    def iter_timeline(self, algo, processes, **params):
+        # Yields (pid, start, finish) segments as the simulation runs; the generator's
+        # return value is the finished processes, in the same form the list methods return.
+        table, procs = self._prepare(processes)
+        order = []
+        yield from self._kernels[algo](self, table, order, **params)
+        return self._finish(table, procs, order)
+
+    def run_compact(self, algo, processes, **params):
+        pids, starts, finishes = array("q"), array("q"), array("q")
+        segments = self.iter_timeline(algo, processes, **params)
+        while True:
+            try:
+                pid, start, finish = next(segments)
+            except StopIteration as done:
+                return done.value, (pids, starts, finishes)
+            pids.append(pid)
+            starts.append(start)
+            finishes.append(finish)
+
+    def _collect(self, algo, processes, **params):
         timeline = []
-        current_time = 0
-        remaining = processes[:]
-        
-        while remaining:
-            available = [p for p in remaining if p.arrival_time <= current_time]
-            
-            if not available:
-                earliest = min(remaining, key=lambda x: x.arrival_time)
-                current_time = earliest.arrival_time
-                continue
-            
-            shortest = min(available, key=lambda x: x.burst_time)
-            
-            shortest.start_time = current_time
-            shortest.completion_time = current_time + shortest.burst_time
-            shortest.turnaround_time = shortest.completion_time - shortest.arrival_time
-            shortest.waiting_time = shortest.start_time - shortest.arrival_time
-            
-            timeline.append(dict(Task=f"P{shortest.pid}", Start=shortest.start_time, Finish=shortest.completion_time, Resource=f"Process {shortest.pid}"))
-            
-            current_time = shortest.completion_time
-            completed.append(shortest)
-            remaining.remove(shortest)
-            
-        return completed, timeline
-
-    def round_robin(self, processes, quantum):
+        segments = self.iter_timeline(algo, processes, **params)
+        while True:
+            try:
+                pid, start, finish = next(segments)
+            except StopIteration as done:
+                return done.value, timeline
+            timeline.append(dict(Task=f"P{pid}", Start=start, Finish=finish, Resource=f"Process {pid}"))
+
+    def _prepare(self, processes):
+        if isinstance(processes, ProcessTable):
+            return processes.sorted_by_arrival(), None
         processes.sort(key=lambda x: x.arrival_time)
-        queue = []
-        timeline = []
+        return ProcessTable.from_processes(processes), processes
+
+    def _finish(self, table, procs, order):
+        if procs is None:
+            return table.take(order)
+        for i, p in enumerate(procs):
+            p.remaining_time = 0
+            p.start_time = table.start_time[i]
+            p.completion_time = table.completion_time[i]
+            p.waiting_time = table.waiting_time[i]
+            p.turnaround_time = table.turnaround_time[i]
+        return [procs[i] for i in order]
+
+    def _fcfs(self, table, order):
+        arrival, burst, pid = table.arrival_time, table.burst_time, table.pid
+        start, completion = table.start_time, table.completion_time
+        waiting, turnaround = table.waiting_time, table.turnaround_time
+        current_time = 0
+
+        for i in range(len(table)):
+            if current_time < arrival[i]:
+                current_time = arrival[i]
+
+            start[i] = current_time
+            completion[i] = current_time + burst[i]
+            turnaround[i] = completion[i] - arrival[i]
+            waiting[i] = current_time - arrival[i]
+            order.append(i)
+
+            yield pid[i], start[i], completion[i]
+            current_time = completion[i]
+
+    def _sjf(self, table, order):
+        arrival, burst, pid = table.arrival_time, table.burst_time, table.pid
+        start, completion = table.start_time, table.completion_time
+        waiting, turnaround = table.waiting_time, table.turnaround_time
+        current_time = 0
+        ready = []
+        i = 0
+        n = len(table)
+
+        while i < n or ready:
+            if not ready and arrival[i] > current_time:
+                current_time = arrival[i]
+
+            while i < n and arrival[i] <= current_time:
+                heapq.heappush(ready, (burst[i], arrival[i], i))
+                i += 1
+
+            s = heapq.heappop(ready)[2]
+
+            start[s] = current_time
+            completion[s] = current_time + burst[s]
+            turnaround[s] = completion[s] - arrival[s]
+            waiting[s] = current_time - arrival[s]
+            order.append(s)
+
+            yield pid[s], start[s], completion[s]
+            current_time = completion[s]
+
+    def _round_robin(self, table, order, quantum, merge=False):
+        arrival, burst, pid = table.arrival_time, table.burst_time, table.pid
+        start, completion = table.start_time, table.completion_time
+        waiting, turnaround = table.waiting_time, table.turnaround_time
+        remaining = array("q", burst)
+        queue = deque()
         current_time = 0
-        completed = []
-        
-        
-        active_pool = [p for p in processes] 
-        if active_pool:
-             queue.append(active_pool.pop(0))
-             current_time = queue[0].arrival_time
-
-        while queue or active_pool:
+        last = -1
+        last_start = 0
+        i = 0
+        n = len(table)
+
+        while queue or i < n:
             if not queue:
-                next_p = active_pool.pop(0)
-                current_time = next_p.arrival_time
-                queue.append(next_p)
-
-            p = queue.pop(0)
-            
-            if p.start_time == -1:
-                p.start_time = current_time
-            
-            exec_time = min(p.remaining_time, quantum)
-            timeline.append(dict(Task=f"P{p.pid}", Start=current_time, Finish=current_time + exec_time, Resource=f"Process {p.pid}"))
-            
-            p.remaining_time -= exec_time
+                if last != -1 and arrival[i] > current_time:
+                    yield pid[last], last_start, current_time
+                    last = -1
+                current_time = max(current_time, arrival[i])
+                queue.append(i)
+                i += 1
+
+            p = queue.popleft()
+
+            if start[p] == -1:
+                start[p] = current_time
+
+            exec_time = min(remaining[p], quantum)
+            if not (merge and p == last):
+                if last != -1:
+                    yield pid[last], last_start, current_time
+                last = p
+                last_start = current_time
+
+            remaining[p] -= exec_time
             current_time += exec_time
-            
-            while active_pool and active_pool[0].arrival_time <= current_time:
-                queue.append(active_pool.pop(0))
-                
-            if p.remaining_time > 0:
+
+            while i < n and arrival[i] <= current_time:
+                queue.append(i)
+                i += 1
+
+            if remaining[p] > 0:
                 queue.append(p)
             else:
-                p.completion_time = current_time
-                p.turnaround_time = p.completion_time - p.arrival_time
-                p.waiting_time = p.turnaround_time - p.burst_time
-                completed.append(p)
-                
-        return completed, timeline
\ No newline at end of file
+                completion[p] = current_time
+                turnaround[p] = current_time - arrival[p]
+                waiting[p] = turnaround[p] - burst[p]
+                order.append(p)
+
+        if last != -1:
+            yield pid[last], last_start, current_time
+
+    def _srtf(self, table, order, merge=False):
+        return self._preemptive(table, order, _SRTFPolicy(table), merge)
+
+    def _mlfq(self, table, order, quanta=(2, 4, 8), boost=None, merge=False):
+        return self._preemptive(table, order, _MLFQPolicy(table, quanta, boost), merge)
+
+    def _preemptive(self, table, order, policy, merge):
+        # Discrete-event loop: time only advances to the next arrival, completion or
+        # policy deadline (quantum expiry, priority boost), never one unit at a time.
+        arrival, burst, pid = table.arrival_time, table.burst_time, table.pid
+        start, completion = table.start_time, table.completion_time
+        waiting, turnaround = table.waiting_time, table.turnaround_time
+        remaining = policy.remaining
+        current_time = 0
+        last = -1
+        last_start = 0
+        i = 0
+        n = len(table)
+
+        while i < n or policy:
+            if not policy:
+                if last != -1 and arrival[i] > current_time:
+                    yield pid[last], last_start, current_time
+                    last = -1
+                current_time = max(current_time, arrival[i])
+                policy.tick(current_time)
+            while i < n and arrival[i] <= current_time:
+                policy.admit(i)
+                i += 1
+
+            p, limit = policy.pick(current_time)
+
+            if start[p] == -1:
+                start[p] = current_time
+            if not (merge and p == last):
+                if last != -1:
+                    yield pid[last], last_start, current_time
+                last = p
+                last_start = current_time
+
+            dispatched = current_time
+            preempted = False
+            end = current_time + min(remaining[p], limit)
+            while i < n and arrival[i] < end:
+                remaining[p] -= arrival[i] - current_time
+                current_time = arrival[i]
+                while i < n and arrival[i] == current_time:
+                    policy.admit(i)
+                    i += 1
+                if policy.preempts(p):
+                    preempted = True
+                    break
+            if not preempted:
+                remaining[p] -= end - current_time
+                current_time = end
+
+            while i < n and arrival[i] <= current_time:
+                policy.admit(i)
+                i += 1
+
+            if remaining[p] > 0:
+                policy.requeue(p, current_time - dispatched)
+            else:
+                completion[p] = current_time
+                turnaround[p] = current_time - arrival[p]
+                waiting[p] = turnaround[p] - burst[p]
+                order.append(p)
+            policy.tick(current_time)
+
+        if last != -1:
+            yield pid[last], last_start, current_time
+
+    _kernels = {
+        "fcfs": _fcfs,
+        "sjf_non_preemptive": _sjf,
+        "round_robin": _round_robin,
+        "srtf": _srtf,
+        "mlfq": _mlfq,
+    }
+
+_sweep_table = None
+
+def _init_sweep_worker(table):
+    global _sweep_table
+    _sweep_table = table
+
+def _rr_sweep_point(table, quantum):
+    table = table if table is not None else _sweep_table
+    segments = CPUScheduler().iter_timeline("round_robin", table, quantum=quantum, merge=True)
+    switches = 0
+    last = None
+    while True:
+        try:
+            pid = next(segments)[0]
+        except StopIteration as done:
+            result = done.value
+            break
+        if last is not None and pid != last:
+            switches += 1
+        last = pid
+
+    n = len(result)
+    makespan = max(result.completion_time) if n else 0
+    return {
+        "Quantum": quantum,
+        "Avg Waiting": sum(result.waiting_time) / n if n else 0,
+        "Avg Turnaround": sum(result.turnaround_time) / n if n else 0,
+        "Throughput": n / makespan if makespan else 0,
+        "Context Switches": switches,
+    }
+
+class _SRTFPolicy:
+    def __init__(self, table):
+        self.arrival = table.arrival_time
+        self.remaining = array("q", table.burst_time)
+        self.ready = []
+
+    def __bool__(self):
+        return bool(self.ready)
+
+    def admit(self, i):
+        heapq.heappush(self.ready, (self.remaining[i], self.arrival[i], i))
+
+    def pick(self, now):
+        return heapq.heappop(self.ready)[2], float("inf")
+
+    def preempts(self, p):
+        return self.ready[0] < (self.remaining[p], self.arrival[p], p)
+
+    def requeue(self, p, ran):
+        self.admit(p)
+
+    def tick(self, now):
+        pass
+
+class _MLFQPolicy:
+    # Per-level FIFO queues are intrusive linked lists over job indices, so a priority
+    # boost splices every level onto level 0 in O(levels); per-job level and quantum
+    # usage are reset lazily by comparing against the boost epoch.
+    def __init__(self, table, quanta, boost):
+        if not quanta or min(quanta) < 1:
+            raise ValueError("quanta must be a non-empty sequence of positive time slices")
+        n = len(table)
+        self.quanta = tuple(quanta)
+        self.lowest = len(self.quanta) - 1
+        self.boost = boost
+        self.next_boost = boost
+        self.remaining = array("q", table.burst_time)
+        self.level = array("q", bytes(8 * n))
+        self.used = array("q", bytes(8 * n))
+        self.epoch = array("q", bytes(8 * n))
+        self.current_epoch = 0
+        self.next = array("q", [-1]) * n
+        self.head = [-1] * len(self.quanta)
+        self.tail = [-1] * len(self.quanta)
+        self.size = 0
+
+    def __bool__(self):
+        return self.size > 0
+
+    def admit(self, i):
+        self.level[i] = 0
+        self.used[i] = 0
+        self.epoch[i] = self.current_epoch
+        self._append(0, i)
+
+    def pick(self, now):
+        for level in range(len(self.quanta)):
+            if self.head[level] != -1:
+                p = self._popleft(level)
+                self._sync(p)
+                limit = self.quanta[level] - self.used[p]
+                if self.size == 0 and 0 < level == self.lowest:
+                    # Alone at the lowest level: successive expiries would just re-pick it.
+                    limit = float("inf")
+                if self.boost:
+                    limit = min(limit, self.next_boost - now)
+                return p, limit
+
+    def preempts(self, p):
+        return any(self.head[level] != -1 for level in range(self.level[p]))
+
+    def requeue(self, p, ran):
+        level = self.level[p]
+        self.used[p] += ran
+        if level == self.lowest and self.used[p] >= self.quanta[level]:
+            self.used[p] %= self.quanta[level]
+            if self.used[p]:
+                self._appendleft(level, p)
+            else:
+                self._append(level, p)
+        elif self.used[p] >= self.quanta[level]:
+            self.level[p] = level + 1
+            self.used[p] = 0
+            self._append(level + 1, p)
+        else:
+            self._appendleft(level, p)
+
+    def tick(self, now):
+        if not self.boost or now < self.next_boost:
+            return
+        while self.next_boost <= now:
+            self.next_boost += self.boost
+        self.current_epoch += 1
+        head = tail = -1
+        for level in range(len(self.quanta)):
+            if self.head[level] == -1:
+                continue
+            if head == -1:
+                head = self.head[level]
+            else:
+                self.next[tail] = self.head[level]
+            tail = self.tail[level]
+            self.head[level] = self.tail[level] = -1
+        self.head[0], self.tail[0] = head, tail
+
+    def _sync(self, p):
+        if self.epoch[p] != self.current_epoch:
+            self.epoch[p] = self.current_epoch
+            self.level[p] = 0
+            self.used[p] = 0
+
+    def _append(self, level, p):
+        self.next[p] = -1
+        if self.head[level] == -1:
+            self.head[level] = p
+        else:
+            self.next[self.tail[level]] = p
+        self.tail[level] = p
+        self.size += 1
+
+    def _appendleft(self, level, p):
+        self.next[p] = self.head[level]
+        if self.head[level] == -1:
+            self.tail[level] = p
+        self.head[level] = p
+        self.size += 1
+
+    def _popleft(self, level):
+        p = self.head[level]
+        self.head[level] = self.next[p]
+        if self.head[level] == -1:
+            self.tail[level] = -1
+        self.size -= 1
+        return p
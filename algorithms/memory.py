@@ -1,51 +1,667 @@
+import heapq
+import mmap
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from itertools import chain, islice
+
+class PageTrace:
+    # Compact step-by-step record of a page replacement run: one (page, hit, evicted page,
+    # frame slot) entry per reference in typed arrays, plus a full copy of the frame slots
+    # every `interval` steps so any step's frames can be rebuilt in O(interval).
+    # Pages are non-negative; -1 marks "no page" (no eviction, empty slot, or a hit's slot).
+    def __init__(self, frames_count, interval=1024):
+        if frames_count < 1 or interval < 1:
+            raise ValueError("frames_count and interval must be positive")
+        self.frames_count = frames_count
+        self.interval = interval
+        self.pages = array("q")
+        self.hits = bytearray()
+        self.evicted = array("q")
+        self.slots = array("l")
+        self.checkpoints = []
+        self.faults = 0
+        self._frames = array("q", [-1]) * frames_count
+        self._slot_of = {}
+
+    def __len__(self):
+        return len(self.pages)
+
+    def record(self, page, hit, victim=-1):
+        if len(self.pages) % self.interval == 0:
+            self.checkpoints.append(array("q", self._frames))
+        slot = -1
+        if not hit:
+            self.faults += 1
+            slot = self._slot_of.pop(victim) if victim != -1 else len(self._slot_of)
+            self._frames[slot] = page
+            self._slot_of[page] = slot
+        self.pages.append(page)
+        self.hits.append(hit)
+        self.evicted.append(victim)
+        self.slots.append(slot)
+
+    def status(self, step):
+        return "Hit" if self.hits[step] else "Miss"
+
+    def next_fault(self, step):
+        # First miss after `step`, or -1.
+        return self.hits.find(0, step + 1)
+
+    def previous_fault(self, step):
+        # Last miss before `step`, or -1.
+        return self.hits.rfind(0, 0, max(step, 0))
+
+    def frames_at(self, step):
+        # Frame slots after `step` has been applied; None marks an empty frame.
+        if not 0 <= step < len(self.pages):
+            raise IndexError("step out of range")
+        base = step - step % self.interval
+        frames = array("q", self.checkpoints[base // self.interval])
+        for k in range(base, step + 1):
+            if self.slots[k] != -1:
+                frames[self.slots[k]] = self.pages[k]
+        return [f if f != -1 else None for f in frames]
+
+    def rows(self, start=0, stop=None, max_frames=None):
+        stop = len(self.pages) if stop is None else min(stop, len(self.pages))
+        if start >= stop:
+            return
+        frames = self.frames_at(start)
+        for k in range(start, stop):
+            if k > start and self.slots[k] != -1:
+                frames[self.slots[k]] = self.pages[k]
+            yield k, self.pages[k], self.status(k), frames[:max_frames]
+
+class ResidentTrace:
+    # Compact record of a run whose resident set changes size (PFF): per reference the page,
+    # whether it hit and the pages released before it was loaded, plus a copy of the resident
+    # set (least recently used first) at most once every max(interval, resident size) steps.
+    # The copies add up to at most one page per reference, and any step is rebuilt by
+    # replaying from the nearest copy before it.
+    def __init__(self, interval=1024):
+        if interval < 1:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.pages = array("q")
+        self.hits = bytearray()
+        # Pages released at step k are released[offsets[k]:offsets[k + 1]].
+        self.released = array("q")
+        self.offsets = array("q", [0])
+        self.checkpoint_steps = array("q")
+        self.checkpoints = []
+        self.faults = 0
+        self._resident = OrderedDict()
+
+    def __len__(self):
+        return len(self.pages)
+
+    def record(self, page, hit, released=()):
+        step = len(self.pages)
+        if not self.checkpoints or step - self.checkpoint_steps[-1] >= max(self.interval, len(self._resident)):
+            self.checkpoint_steps.append(step)
+            self.checkpoints.append(array("q", self._resident))
+        if not hit:
+            self.faults += 1
+            self.released.extend(released)
+        self.pages.append(page)
+        self.hits.append(hit)
+        self.offsets.append(len(self.released))
+        self._replay(self._resident, step)
+
+    def status(self, step):
+        return "Hit" if self.hits[step] else "Miss"
+
+    def next_fault(self, step):
+        return self.hits.find(0, step + 1)
+
+    def previous_fault(self, step):
+        return self.hits.rfind(0, 0, max(step, 0))
+
+    def frames_at(self, step):
+        # Resident pages after `step` has been applied, least recently used first.
+        return list(self._resident_after(step))
+
+    def rows(self, start=0, stop=None, max_frames=None):
+        stop = len(self.pages) if stop is None else min(stop, len(self.pages))
+        if start >= stop:
+            return
+        frames = self._resident_after(start)
+        for k in range(start, stop):
+            if k > start:
+                self._replay(frames, k)
+            yield k, self.pages[k], self.status(k), list(islice(frames, max_frames))
+
+    def _resident_after(self, step):
+        if not 0 <= step < len(self.pages):
+            raise IndexError("step out of range")
+        c = bisect_right(self.checkpoint_steps, step) - 1
+        frames = OrderedDict.fromkeys(self.checkpoints[c])
+        for k in range(self.checkpoint_steps[c], step + 1):
+            self._replay(frames, k)
+        return frames
+
+    def _replay(self, frames, k):
+        page = self.pages[k]
+        if self.hits[k]:
+            frames.move_to_end(page)
+        else:
+            for p in self.released[self.offsets[k]:self.offsets[k + 1]]:
+                del frames[p]
+            frames[page] = None
+
+
+class TraceFile:
+    # Page reference trace read from a path or an open (e.g. uploaded) file. Text traces are
+    # integers separated by commas or whitespace, parsed block by block into one typed
+    # array; raw int32/int64 traces (native byte order) are memory-mapped when they come
+    # from a real file and viewed in place otherwise. Iterating yields pages chunk by chunk,
+    # so the policies stream the trace without a list of Python ints ever being built.
+    formats = {"text": None, "int32": "i", "int64": "q"}
+
+    def __init__(self, source, fmt="text", chunk_size=1 << 16):
+        if fmt not in self.formats:
+            raise ValueError(f"unknown trace format {fmt!r}, expected one of {tuple(self.formats)}")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self._file = None
+        self._mmap = None
+        self.pages = None
+        if fmt == "text":
+            self._raw = None
+            self.pages = memoryview(self._parse(source))
+        else:
+            self._raw = self._map(source)
+            width = array(self.formats[fmt]).itemsize
+            if len(self._raw) % width:
+                self.close()
+                raise ValueError(f"{fmt} trace size is not a multiple of {width} bytes")
+            self.pages = self._raw.cast(self.formats[fmt])
+
+    def __len__(self):
+        return len(self.pages)
+
+    def __iter__(self):
+        return chain.from_iterable(self.chunks())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def chunks(self):
+        for start in range(0, len(self.pages), self.chunk_size):
+            yield self.pages[start:start + self.chunk_size]
+
+    def close(self):
+        if self.pages is not None:
+            self.pages.release()
+        if self._raw is not None:
+            self._raw.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        if self._file is not None:
+            self._file.close()
+        self.pages = self._raw = self._mmap = self._file = None
+
+    def _parse(self, source):
+        pages = array("q")
+        f = source if hasattr(source, "read") else open(source, "rb")
+        try:
+            tail = None
+            while True:
+                block = f.read(self.chunk_size)
+                if not block:
+                    break
+                comma, space = (",", " ") if isinstance(block, str) else (b",", b" ")
+                block = block.replace(comma, space)
+                if tail:
+                    block = tail + block
+                tokens = block.split()
+                # A token touching the end of the block may continue in the next one.
+                tail = tokens.pop() if tokens and not block[-1:].isspace() else None
+                pages.extend(map(int, tokens))
+            if tail:
+                pages.append(int(tail))
+        finally:
+            if f is not source:
+                f.close()
+        return pages
+
+    def _map(self, source):
+        if hasattr(source, "getbuffer"):
+            return memoryview(source.getbuffer())
+        if not hasattr(source, "read"):
+            self._file = open(source, "rb")
+            source = self._file
+        try:
+            fileno = source.fileno()
+        except (AttributeError, OSError):
+            return memoryview(source.read())
+        try:
+            self._mmap = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            return memoryview(b"")
+        return memoryview(self._mmap)
+
+
 class MemoryManager:
-    def fifo(self, pages, frames_count):
-        frames = []
+    def fifo(self, pages, frames_count, snapshots=True, trace=None):
+        # resident answers membership in O(1); frames holds the load order for eviction.
+        frames = deque()
+        resident = set()
+        page_faults = 0
+        history = []
+
+        for page in pages:
+            status = "Hit"
+            victim = -1
+            if page not in resident:
+                status = "Miss"
+                page_faults += 1
+                if len(frames) >= frames_count:
+                    victim = frames.popleft()
+                    resident.discard(victim)
+                frames.append(page)
+                resident.add(page)
+
+            if trace is not None:
+                trace.record(page, status == "Hit", victim)
+            if snapshots:
+                history.append({
+                    "Page": page,
+                    "Frames": list(frames),
+                    "Status": status
+                })
+
+        return page_faults, history
+
+    def lru(self, pages, frames_count, snapshots=True, trace=None):
+        # frames is kept in recency order: the first key is always the LRU victim.
+        frames = OrderedDict()
         page_faults = 0
-        snapshots = [] 
+        history = []
 
         for page in pages:
             status = "Hit"
+            victim = -1
+            if page in frames:
+                frames.move_to_end(page)
+            else:
+                status = "Miss"
+                page_faults += 1
+                if len(frames) >= frames_count:
+                    victim = frames.popitem(last=False)[0]
+                frames[page] = None
+
+            if trace is not None:
+                trace.record(page, status == "Hit", victim)
+            if snapshots:
+                history.append({
+                    "Page": page,
+                    "Frames": list(frames),
+                    "Status": status
+                })
+
+        return page_faults, history
+
+    def opt(self, pages, frames_count, snapshots=True, trace=None):
+        # Belady's OPT: a first pass gives every reference the position of the page's next
+        # use, and a max-heap on that position picks the victim. Heap entries go stale when a
+        # page is referenced again; they are skipped on pop and the heap is rebuilt from the
+        # resident set whenever stale entries outnumber live ones. Both passes only iterate,
+        # so `pages` may be any re-iterable sequence such as a TraceFile.
+        n = len(pages)
+        next_use = array("q", [n]) * n
+        seen = {}
+        for t, page in enumerate(pages):
+            prev = seen.get(page)
+            if prev is not None:
+                next_use[prev] = t
+            seen[page] = t
+
+        frames = {}
+        heap = []
+        page_faults = 0
+        history = []
+
+        for t, page in enumerate(pages):
+            status = "Hit"
+            victim = -1
             if page not in frames:
                 status = "Miss"
                 page_faults += 1
-                if len(frames) < frames_count:
-                    frames.append(page)
-                else:
-                    frames.pop(0) 
-                    frames.append(page)
-            
-            snapshots.append({
-                "Page": page,
-                "Frames": list(frames), 
-                "Status": status
-            })
-            
-        return page_faults, snapshots
-
-    def lru(self, pages, frames_count):
+                if len(frames) >= frames_count:
+                    while True:
+                        farthest, candidate = heapq.heappop(heap)
+                        if frames.get(candidate) == -farthest:
+                            break
+                    victim = candidate
+                    del frames[victim]
+            frames[page] = next_use[t]
+            heapq.heappush(heap, (-next_use[t], page))
+            if len(heap) > 2 * frames_count + 64:
+                heap = [(-when, resident) for resident, when in frames.items()]
+                heapq.heapify(heap)
+
+            if trace is not None:
+                trace.record(page, status == "Hit", victim)
+            if snapshots:
+                history.append({
+                    "Page": page,
+                    "Frames": list(frames),
+                    "Status": status
+                })
+
+        return page_faults, history
+
+    def clock(self, pages, frames_count, snapshots=True, trace=None):
+        # Second chance on a ring of slots: the hand clears reference bits until it finds
+        # a page that has not been used since its last pass, and evicts that one.
         frames = []
+        referenced = bytearray(frames_count)
+        slot_of = {}
+        hand = 0
         page_faults = 0
-        snapshots = []
-        
+        history = []
+
         for page in pages:
             status = "Hit"
-            if page not in frames:
+            victim = -1
+            slot = slot_of.get(page)
+            if slot is not None:
+                referenced[slot] = 1
+            else:
                 status = "Miss"
                 page_faults += 1
                 if len(frames) < frames_count:
+                    slot = len(frames)
                     frames.append(page)
                 else:
-                    frames.pop(0) 
-                    frames.append(page)
+                    while referenced[hand]:
+                        referenced[hand] = 0
+                        hand = (hand + 1) % frames_count
+                    slot = hand
+                    victim = frames[slot]
+                    del slot_of[victim]
+                    frames[slot] = page
+                    hand = (hand + 1) % frames_count
+                slot_of[page] = slot
+                referenced[slot] = 1
+
+            if trace is not None:
+                trace.record(page, status == "Hit", victim)
+            if snapshots:
+                history.append({
+                    "Page": page,
+                    "Frames": list(frames),
+                    "Status": status
+                })
+
+        return page_faults, history
+
+    def lfu(self, pages, frames_count, snapshots=True, trace=None):
+        # O(1) LFU: pages are grouped in per-frequency buckets (each in LRU order, which
+        # breaks ties) and min_freq always points at the bucket holding the victim.
+        frequency = {}
+        buckets = {}
+        min_freq = 0
+        page_faults = 0
+        history = []
+
+        for page in pages:
+            status = "Hit"
+            victim = -1
+            freq = frequency.get(page)
+            if freq is not None:
+                bucket = buckets[freq]
+                del bucket[page]
+                if not bucket:
+                    del buckets[freq]
+                    if min_freq == freq:
+                        min_freq = freq + 1
+                frequency[page] = freq + 1
+                buckets.setdefault(freq + 1, OrderedDict())[page] = None
             else:
-                frames.remove(page)
-                frames.append(page)
-                
-            snapshots.append({
-                "Page": page,
-                "Frames": list(frames),
-                "Status": status
-            })
-            
-        return page_faults, snapshots
\ No newline at end of file
+                status = "Miss"
+                page_faults += 1
+                if len(frequency) >= frames_count:
+                    bucket = buckets[min_freq]
+                    victim = bucket.popitem(last=False)[0]
+                    if not bucket:
+                        del buckets[min_freq]
+                    del frequency[victim]
+                frequency[page] = 1
+                buckets.setdefault(1, OrderedDict())[page] = None
+                min_freq = 1
+
+            if trace is not None:
+                trace.record(page, status == "Hit", victim)
+            if snapshots:
+                history.append({
+                    "Page": page,
+                    "Frames": list(frequency),
+                    "Status": status
+                })
+
+        return page_faults, history
+
+    def arc(self, pages, frames_count, snapshots=True, trace=None):
+        # Adaptive Replacement Cache (Megiddo & Modha). t1/t2 hold resident pages seen once /
+        # more than once, b1/b2 are ghost lists of their recent victims, and a ghost hit moves
+        # the target size p of t1 towards whichever list would have kept the page.
+        c = frames_count
+        t1, t2, b1, b2 = OrderedDict(), OrderedDict(), OrderedDict(), OrderedDict()
+        p = 0
+        page_faults = 0
+        history = []
+
+        def replace(in_b2):
+            if t1 and (len(t1) > p or (in_b2 and len(t1) == p)):
+                evicted = t1.popitem(last=False)[0]
+                b1[evicted] = None
+            else:
+                evicted = t2.popitem(last=False)[0]
+                b2[evicted] = None
+            return evicted
+
+        for page in pages:
+            status = "Hit"
+            victim = -1
+            if page in t1:
+                del t1[page]
+                t2[page] = None
+            elif page in t2:
+                t2.move_to_end(page)
+            else:
+                status = "Miss"
+                page_faults += 1
+                if page in b1:
+                    p = min(c, p + max(len(b2) // len(b1), 1))
+                    victim = replace(False)
+                    del b1[page]
+                    t2[page] = None
+                elif page in b2:
+                    p = max(0, p - max(len(b1) // len(b2), 1))
+                    victim = replace(True)
+                    del b2[page]
+                    t2[page] = None
+                else:
+                    if len(t1) + len(b1) == c:
+                        if len(t1) < c:
+                            b1.popitem(last=False)
+                            victim = replace(False)
+                        else:
+                            victim = t1.popitem(last=False)[0]
+                    elif len(t1) + len(t2) + len(b1) + len(b2) >= c:
+                        if len(t1) + len(t2) + len(b1) + len(b2) == 2 * c:
+                            b2.popitem(last=False)
+                        victim = replace(False)
+                    t1[page] = None
+
+            if trace is not None:
+                trace.record(page, status == "Hit", victim)
+            if snapshots:
+                history.append({
+                    "Page": page,
+                    "Frames": list(t1) + list(t2),
+                    "Status": status
+                })
+
+        return page_faults, history
+
+    def two_q(self, pages, frames_count, snapshots=True, trace=None):
+        # Full 2Q (Johnson & Shasha): first-time pages enter the a1in FIFO; pages evicted from
+        # it are remembered in the a1out ghost FIFO, and a re-reference from there promotes the
+        # page into the am LRU. Kin is a quarter of the frames, Kout half of them.
+        k_in = max(1, frames_count // 4)
+        k_out = max(1, frames_count // 2)
+        a1in, a1out, am = OrderedDict(), OrderedDict(), OrderedDict()
+        page_faults = 0
+        history = []
+
+        for page in pages:
+            status = "Hit"
+            victim = -1
+            if page in am:
+                am.move_to_end(page)
+            elif page not in a1in:
+                status = "Miss"
+                page_faults += 1
+                # Checked before reclaiming: the page a1in evicts could push this one out of a1out.
+                remembered = page in a1out
+                if remembered:
+                    del a1out[page]
+                if len(a1in) + len(am) >= frames_count:
+                    if len(a1in) > k_in or not am:
+                        victim = a1in.popitem(last=False)[0]
+                        a1out[victim] = None
+                        if len(a1out) > k_out:
+                            a1out.popitem(last=False)
+                    else:
+                        victim = am.popitem(last=False)[0]
+                if remembered:
+                    am[page] = None
+                else:
+                    a1in[page] = None
+
+            if trace is not None:
+                trace.record(page, status == "Hit", victim)
+            if snapshots:
+                history.append({
+                    "Page": page,
+                    "Frames": list(a1in) + list(am),
+                    "Status": status
+                })
+
+        return page_faults, history
+
+    def lru_fault_curve(self, pages, max_frames=None):
+        # Mattson stack distances in one pass: a Fenwick tree over time marks the latest
+        # reference of every page, so a page's LRU stack depth is the number of marks after
+        # its previous reference. curve[k - 1] is the LRU fault count with k frames.
+        n = len(pages)
+        tree = array("l", [0]) * (n + 1)
+        last_seen = {}
+        depths = array("l", [0]) * (n + 2)
+
+        for t, page in enumerate(pages, 1):
+            prev = last_seen.get(page)
+            if prev is not None:
+                # Every mark sits at or before t - 1, so marks after prev = all marks - prefix(prev).
+                marked = len(last_seen)
+                i = prev
+                while i > 0:
+                    marked -= tree[i]
+                    i -= i & -i
+                depths[marked + 1] += 1
+                i = prev
+                while i <= n:
+                    tree[i] -= 1
+                    i += i & -i
+            i = t
+            while i <= n:
+                tree[i] += 1
+                i += i & -i
+            last_seen[page] = t
+
+        limit = len(last_seen) if max_frames is None else max_frames
+        curve = []
+        faults = n
+        for k in range(1, limit + 1):
+            faults -= depths[k] if k <= n else 0
+            curve.append(faults)
+        return curve
+
+
+    def working_set_sizes(self, pages, tau):
+        # Denning working set W(t, tau): the distinct pages among the last tau references,
+        # for every t. A page's last reference time says whether it is still in the window,
+        # so each step adds at most one page and drops at most the one leaving the window.
+        if tau < 1:
+            raise ValueError("tau must be positive")
+        window = deque()
+        last_ref = {}
+        size = 0
+        sizes = array("l")
+
+        for t, page in enumerate(pages):
+            if len(window) == tau:
+                leaving = window.popleft()
+                if last_ref[leaving] == t - tau:
+                    del last_ref[leaving]
+                    size -= 1
+            if page not in last_ref:
+                size += 1
+            last_ref[page] = t
+            window.append(page)
+            sizes.append(size)
+        return sizes
+
+    def pff(self, pages, threshold, snapshots=True, allocation=None, trace=None):
+        # Page-fault-frequency allocation (Chu & Opderbeck): the resident set grows by one page
+        # on every fault, but when more than `threshold` references have passed since the
+        # previous fault, pages not referenced since then (counting that fault's own page as
+        # referenced) are released first. frames maps each page to its last reference time and
+        # is kept in recency order, so the released pages are a prefix of it.
+        # allocation, if given, receives the resident set size after every reference; trace,
+        # if given, is a ResidentTrace that records the run compactly.
+        if threshold < 1:
+            raise ValueError("threshold must be positive")
+        frames = OrderedDict()
+        last_fault = 0
+        page_faults = 0
+        history = []
+
+        for t, page in enumerate(pages, 1):
+            status = "Hit"
+            released = ()
+            if page in frames:
+                frames.move_to_end(page)
+                frames[page] = t
+            else:
+                status = "Miss"
+                page_faults += 1
+                released = []
+                if t - last_fault > threshold:
+                    while frames and next(iter(frames.values())) < last_fault:
+                        released.append(frames.popitem(last=False)[0])
+                last_fault = t
+                frames[page] = t
+
+            if allocation is not None:
+                allocation.append(len(frames))
+            if trace is not None:
+                trace.record(page, status == "Hit", released)
+            if snapshots:
+                history.append({
+                    "Page": page,
+                    "Frames": list(frames),
+                    "Status": status
+                })
+
+        return page_faults, history
@@ -0,0 +1,132 @@
+from array import array
+from collections import OrderedDict
+
+class PagingSystem:
+    # Several processes share one pool of physical frames. Each process has its own page
+    # table (page -> frame), an LRU TLB caches (pid, page) -> frame translations in front of
+    # them, and a fault takes a free frame or evicts one chosen by LRU or FIFO, either among
+    # all frames ("global") or among the faulting process's own frames ("local", with the
+    # pool split evenly between the processes unless quotas are given).
+    scopes = ("global", "local")
+    algorithms = ("lru", "fifo")
+
+    def __init__(self, frames_count, tlb_size=16, scope="global", algorithm="lru",
+                 tlb_time=1, memory_time=100, fault_time=8_000_000):
+        if frames_count < 1 or tlb_size < 0:
+            raise ValueError("frames_count must be positive and tlb_size non-negative")
+        if scope not in self.scopes:
+            raise ValueError(f"unknown replacement scope {scope!r}, expected one of {self.scopes}")
+        if algorithm not in self.algorithms:
+            raise ValueError(f"unknown replacement algorithm {algorithm!r}, expected one of {self.algorithms}")
+        self.frames_count = frames_count
+        self.tlb_size = tlb_size
+        self.scope = scope
+        self.algorithm = algorithm
+        # Access times (ns) for the effective memory access time.
+        self.tlb_time = tlb_time
+        self.memory_time = memory_time
+        self.fault_time = fault_time
+
+    def run(self, pids, pages, quotas=None):
+        # pids and pages are parallel sequences of one interleaved trace. Returns (per-process
+        # rows, stats). quotas maps pid -> frames for local replacement; without it pids is
+        # read twice, once to find the processes.
+        local = self.scope == "local"
+        if local:
+            quotas = self._quotas(pids, quotas)
+        lru = self.algorithm == "lru"
+        tlb_size = self.tlb_size
+
+        tables = {}
+        owned = {}
+        refs = {}
+        faults = {}
+        tlb = OrderedDict()
+        # Frames in eviction order: one OrderedDict for the whole pool, or one per process.
+        queue = OrderedDict()
+        free = list(range(self.frames_count - 1, -1, -1))
+        frame_pid = array("q", [-1]) * self.frames_count
+        frame_page = array("q", [-1]) * self.frames_count
+        tlb_hits = 0
+        total = 0
+
+        for pid, page in zip(pids, pages):
+            total += 1
+            table = tables.get(pid)
+            if table is None:
+                if local and pid not in quotas:
+                    raise ValueError(f"no frame quota for process {pid}")
+                table = tables[pid] = {}
+                owned[pid] = OrderedDict() if local else queue
+                refs[pid] = faults[pid] = 0
+            order = owned[pid]
+            refs[pid] += 1
+
+            key = (pid, page)
+            frame = tlb.get(key)
+            if frame is not None:
+                tlb_hits += 1
+                tlb.move_to_end(key)
+                if lru:
+                    order.move_to_end(frame)
+                continue
+
+            frame = table.get(page)
+            if frame is None:
+                faults[pid] += 1
+                if free and not (local and len(order) >= quotas[pid]):
+                    frame = free.pop()
+                else:
+                    frame = order.popitem(last=False)[0]
+                    victim_pid = frame_pid[frame]
+                    victim_page = frame_page[frame]
+                    del tables[victim_pid][victim_page]
+                    tlb.pop((victim_pid, victim_page), None)
+                table[page] = frame
+                frame_pid[frame] = pid
+                frame_page[frame] = page
+                order[frame] = None
+            elif lru:
+                order.move_to_end(frame)
+
+            if tlb_size:
+                tlb[key] = frame
+                if len(tlb) > tlb_size:
+                    tlb.popitem(last=False)
+
+        rows = []
+        for pid in sorted(refs):
+            rows.append({
+                "PID": pid,
+                "References": refs[pid],
+                "Faults": faults[pid],
+                "Fault Rate": faults[pid] / refs[pid],
+                "Resident": len(tables[pid]),
+            })
+        page_faults = sum(faults.values())
+        tlb_ratio = tlb_hits / total if total else 0
+        fault_rate = page_faults / total if total else 0
+        # Every access looks up the TLB and then reads memory; a TLB miss adds one page table
+        # read, and a fault adds the time to service it.
+        emat = (self.tlb_time + self.memory_time + (1 - tlb_ratio) * self.memory_time
+                + fault_rate * self.fault_time) if total else 0
+        stats = {
+            "References": total,
+            "TLB Hits": tlb_hits,
+            "TLB Hit Ratio": tlb_ratio,
+            "Page Faults": page_faults,
+            "Fault Rate": fault_rate,
+            "EMAT": emat,
+        }
+        return rows, stats
+
+    def _quotas(self, pids, quotas):
+        if quotas is None:
+            processes = sorted(set(pids))
+            if len(processes) > self.frames_count:
+                raise ValueError("local replacement needs at least one frame per process")
+            share, extra = divmod(self.frames_count, max(len(processes), 1))
+            return {pid: share + (k < extra) for k, pid in enumerate(processes)}
+        if any(q < 1 for q in quotas.values()) or sum(quotas.values()) > self.frames_count:
+            raise ValueError("quotas must be positive and fit in frames_count")
+        return quotas
@@ -0,0 +1,227 @@
+import heapq
+from array import array
+from collections import deque
+
+from .cpu import CPUScheduler
+
+class SMPScheduler:
+    policies = ("global", "least_loaded", "work_stealing")
+
+    def __init__(self, cores, policy="global"):
+        if cores < 1:
+            raise ValueError("cores must be at least 1")
+        if policy not in self.policies:
+            raise ValueError(f"unknown load-balancing policy {policy!r}, expected one of {self.policies}")
+        self.cores = cores
+        self.policy = policy
+
+    def fcfs(self, processes):
+        return self.run("fcfs", processes)
+
+    def sjf_non_preemptive(self, processes):
+        return self.run("sjf_non_preemptive", processes)
+
+    def round_robin(self, processes, quantum):
+        return self.run("round_robin", processes, quantum)
+
+    def run(self, algo, processes, quantum=None):
+        # Returns (finished processes, (core, pid, start, finish) timeline columns, stats).
+        if algo not in ("fcfs", "sjf_non_preemptive", "round_robin"):
+            raise ValueError(f"unknown algorithm {algo!r}")
+        if algo == "round_robin" and (quantum is None or quantum < 1):
+            raise ValueError("round_robin needs a positive quantum")
+
+        uni = CPUScheduler()
+        table, procs = uni._prepare(processes)
+        order = []
+        timeline, stats = self._simulate(table, order, algo, quantum)
+        return uni._finish(table, procs, order), timeline, stats
+
+    def _simulate(self, table, order, algo, quantum):
+        arrival, burst, pid = table.arrival_time, table.burst_time, table.pid
+        start, completion = table.start_time, table.completion_time
+        waiting, turnaround = table.waiting_time, table.turnaround_time
+        n = len(table)
+        cores = self.cores
+        shared = self.policy == "global"
+        least_loaded = self.policy == "least_loaded"
+        stealing = self.policy == "work_stealing"
+        sjf = algo == "sjf_non_preemptive"
+        slice_len = quantum if algo == "round_robin" else None
+
+        remaining = array("q", burst)
+        last_core = array("q", [-1]) * n
+        queues = [[] if sjf else deque() for _ in range(1 if shared else cores)]
+        qlen = [0] * len(queues)
+        queued = 0
+        # Heaps with lazy deletion. Each one is kept within a small multiple of cores: a core
+        # is listed in idle at most once, and the others are rebuilt once stale entries pile up.
+        idle = list(range(cores)) if shared or stealing else []
+        listed = bytearray(b"\x01") * cores
+        is_idle = bytearray(b"\x01") * cores
+        wake = []
+        running = []
+        load = [0] * cores
+        load_heap = [(0, c) for c in range(cores)]
+        steal_heap = []
+        next_home = 0
+        busy = [0] * cores
+        migrations = 0
+        steals = 0
+        tl_core, tl_pid, tl_start, tl_finish = array("q"), array("q"), array("q"), array("q")
+        pend_job = [-1] * cores
+        pend_start = [0] * cores
+        pend_end = [0] * cores
+
+        def enqueue(q, j):
+            nonlocal queued
+            if sjf:
+                heapq.heappush(queues[q], (burst[j], arrival[j], j))
+            else:
+                queues[q].append(j)
+            qlen[q] += 1
+            queued += 1
+            if stealing:
+                push_steal(q)
+            if not shared and is_idle[q]:
+                wake.append(q)
+
+        def dequeue(q, steal=False):
+            nonlocal queued
+            if sjf:
+                j = (queues[q].pop() if steal else heapq.heappop(queues[q]))[2]
+            else:
+                j = queues[q].pop() if steal else queues[q].popleft()
+            qlen[q] -= 1
+            queued -= 1
+            if stealing:
+                push_steal(q)
+            return j
+
+        def push_steal(q):
+            if len(steal_heap) > 4 * cores:
+                steal_heap[:] = [(-qlen[k], k) for k in range(cores)]
+                heapq.heapify(steal_heap)
+            else:
+                heapq.heappush(steal_heap, (-qlen[q], q))
+
+        def push_load(c):
+            if len(load_heap) > 4 * cores:
+                load_heap[:] = [(load[k], k) for k in range(cores)]
+                heapq.heapify(load_heap)
+            else:
+                heapq.heappush(load_heap, (load[c], c))
+
+        def home(j):
+            nonlocal next_home
+            if shared:
+                return 0
+            if least_loaded:
+                while load_heap[0][0] != load[load_heap[0][1]]:
+                    heapq.heappop(load_heap)
+                c = load_heap[0][1]
+                load[c] += remaining[j]
+                push_load(c)
+                return c
+            c = next_home
+            next_home = (next_home + 1) % cores
+            return c
+
+        def flush(c):
+            if pend_job[c] != -1:
+                tl_core.append(c)
+                tl_pid.append(pid[pend_job[c]])
+                tl_start.append(pend_start[c])
+                tl_finish.append(pend_end[c])
+
+        def dispatch(c, j, now):
+            nonlocal migrations
+            is_idle[c] = 0
+            if start[j] == -1:
+                start[j] = now
+            if last_core[j] != -1 and last_core[j] != c:
+                migrations += 1
+            last_core[j] = c
+            run = remaining[j] if slice_len is None else min(remaining[j], slice_len)
+            heapq.heappush(running, (now + run, c, j, run))
+            if pend_job[c] == j and pend_end[c] == now:
+                pend_end[c] = now + run
+            else:
+                flush(c)
+                pend_job[c], pend_start[c], pend_end[c] = j, now, now + run
+
+        def next_idle():
+            while idle and not is_idle[idle[0]]:
+                listed[heapq.heappop(idle)] = 0
+            if not idle:
+                return -1
+            c = heapq.heappop(idle)
+            listed[c] = 0
+            return c
+
+        i = 0
+        current_time = 0
+        while i < n or running or queued:
+            if running and (i >= n or running[0][0] <= arrival[i]):
+                current_time = running[0][0]
+            else:
+                current_time = max(current_time, arrival[i])
+
+            preempted = []
+            while running and running[0][0] == current_time:
+                _, c, j, run = heapq.heappop(running)
+                remaining[j] -= run
+                busy[c] += run
+                if least_loaded:
+                    load[c] -= run
+                    push_load(c)
+                if remaining[j] > 0:
+                    preempted.append((c, j))
+                else:
+                    completion[j] = current_time
+                    turnaround[j] = current_time - arrival[j]
+                    waiting[j] = turnaround[j] - burst[j]
+                    order.append(j)
+                is_idle[c] = 1
+                if (shared or stealing) and not listed[c]:
+                    listed[c] = 1
+                    heapq.heappush(idle, c)
+                wake.append(c)
+
+            while i < n and arrival[i] <= current_time:
+                enqueue(home(i), i)
+                i += 1
+            for c, j in preempted:
+                enqueue(0 if shared else c, j)
+
+            if shared:
+                while qlen[0]:
+                    c = next_idle()
+                    if c == -1:
+                        break
+                    dispatch(c, dequeue(0), current_time)
+            else:
+                for c in wake:
+                    if is_idle[c] and qlen[c]:
+                        dispatch(c, dequeue(c), current_time)
+                while stealing and queued:
+                    c = next_idle()
+                    if c == -1:
+                        break
+                    while qlen[steal_heap[0][1]] != -steal_heap[0][0]:
+                        heapq.heappop(steal_heap)
+                    steals += 1
+                    dispatch(c, dequeue(steal_heap[0][1], steal=True), current_time)
+            wake.clear()
+
+        for c in range(cores):
+            flush(c)
+        makespan = current_time if n else 0
+        stats = {
+            "Makespan": makespan,
+            "Migrations": migrations,
+            "Steals": steals,
+            "Busy": busy,
+            "Utilisation": [b / makespan if makespan else 0 for b in busy],
+        }
+        return (tl_core, tl_pid, tl_start, tl_finish), stats
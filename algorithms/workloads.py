@@ -0,0 +1,66 @@
+import numpy as np
+
+# Seeded synthetic page reference strings. Every generator returns an int64 NumPy array of
+# n non-negative page numbers and builds it with whole-array operations, so 10^7 references
+# take well under a second. Pass memoryview(array) to the MemoryManager policies to iterate it as
+# plain ints without copying it into a list.
+
+
+def zipf(n, pages, alpha=1.0, seed=0):
+    # Bounded Zipf: the k-th most popular of `pages` pages is referenced with probability
+    # proportional to 1 / k**alpha. Drawing every page's count from one multinomial and
+    # shuffling the repeated pages gives the same distribution as n independent draws,
+    # without a per-reference CDF search. Popularity ranks are shuffled onto page numbers
+    # so the hot set is not simply the lowest pages.
+    _check(n, pages)
+    rng = np.random.default_rng(seed)
+    weights = np.arange(1, pages + 1, dtype=np.float64) ** -alpha
+    counts = rng.multinomial(n, weights / weights.sum())
+    refs = np.repeat(rng.permutation(pages).astype(np.int64), counts)
+    rng.shuffle(refs)
+    return refs
+
+
+def sequential_scan(n, start=0):
+    # One pass over n distinct pages: every reference is a compulsory miss.
+    _check(n, 1)
+    return np.arange(start, start + n, dtype=np.int64)
+
+
+def loop(n, length):
+    # 0, 1, ..., length - 1 repeated. With fewer than `length` frames, LRU and FIFO miss on
+    # every reference while OPT keeps most of the loop resident.
+    _check(n, length)
+    return np.arange(n, dtype=np.int64) % length
+
+
+def phases(n, pages, phase_count=4, working_set=8, seed=0):
+    # n references split into phase_count equal phases; each phase draws uniformly from its
+    # own working set of `working_set` pages chosen at random out of `pages`.
+    _check(n, pages)
+    if phase_count < 1 or not 1 <= working_set <= pages:
+        raise ValueError("phase_count must be positive and working_set between 1 and pages")
+    rng = np.random.default_rng(seed)
+    sets = np.stack([rng.choice(pages, working_set, replace=False) for _ in range(phase_count)])
+    phase = np.arange(n, dtype=np.int64) * phase_count // max(n, 1)
+    return sets[phase, rng.integers(0, working_set, n)].astype(np.int64)
+
+
+def _check(n, pages):
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if pages < 1:
+        raise ValueError("the number of pages must be positive")
+
+
+def interleaved(n, processes, pages, alpha=1.0, time_slice=100, seed=0):
+    # Multi-process trace as parallel (pids, pages) arrays: the CPU runs a random process
+    # (pids 1..processes) for time_slice references at a time, and every process draws from
+    # its own address space of `pages` pages with Zipf popularity.
+    _check(n, pages)
+    if processes < 1 or time_slice < 1:
+        raise ValueError("processes and time_slice must be positive")
+    rng = np.random.default_rng(seed)
+    slices = rng.integers(1, processes + 1, -(-n // time_slice), dtype=np.int64)
+    pids = np.repeat(slices, time_slice)[:n]
+    return pids, zipf(n, pages, alpha, seed + 1)
@@ -1,9 +1,10 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from algorithms.cpu import CPUScheduler, Process
-from algorithms.memory import MemoryManager
+from array import array
+from algorithms.cache import ResultCache
+from algorithms.cpu import CPUScheduler, ProcessTable
+from algorithms.memory import MemoryManager, PageTrace, ResidentTrace, TraceFile
+from algorithms.paging import PagingSystem
+from algorithms.smp import SMPScheduler
 
 st.set_page_config(
     page_title="OS Simulator",
@@ -12,7 +13,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-st.markdown("""
+# pandas, NumPy and Plotly are imported where they are first needed, so the server does not
+# load them until a page draws a table or chart. The stylesheet is built once per process.
+@st.cache_resource
+def page_css():
+    return """
 <style>
     /* ===== Google Font ===== */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&display=swap');
@@ -500,7 +505,82 @@ st.markdown("""
     }
 
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+st.markdown(page_css(), unsafe_allow_html=True)
+
+
+# Longest reference string the memory module records a step-by-step table for.
+MAX_TRACE_STEPS = 200_000
+# Frame columns drawn per step; PFF's resident set can grow far beyond this.
+MAX_FRAME_COLUMNS = 64
+# Simulation results kept in the result cache shared by all sessions, by count and by
+# approximate size (a 10^6-process CPU result alone is over 100 MB).
+RESULT_CACHE_ENTRIES = 32
+RESULT_CACHE_BYTES = 512 * 2 ** 20
+# Rows of the CPU process queue table and process chips drawn for large workloads.
+MAX_QUEUE_ROWS = 1000
+MAX_CHIPS = 50
+
+
+@st.cache_resource
+def result_cache():
+    return ResultCache(RESULT_CACHE_ENTRIES, RESULT_CACHE_BYTES)
+
+
+def read_workload(uploaded_file):
+    # Reads an uploaded CSV, Parquet or Arrow (Feather) workload and validates and casts each
+    # column as a whole, so a large upload never turns into one Python object per row.
+    import numpy as np
+    import pandas as pd
+
+    name = uploaded_file.name.lower()
+    if name.endswith(".parquet"):
+        df = pd.read_parquet(uploaded_file)
+    elif name.endswith((".arrow", ".feather")):
+        df = pd.read_feather(uploaded_file)
+    else:
+        df = pd.read_csv(uploaded_file)
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    missing = [c for c in ("pid", "arrival", "burst") if c not in df.columns]
+    if missing:
+        raise ValueError(f"missing column(s) {', '.join(missing)}")
+
+    columns = {}
+    for name in ("pid", "arrival", "burst", "priority"):
+        if name not in df.columns:
+            continue
+        values = pd.to_numeric(df[name]).to_numpy()
+        if values.dtype.kind not in "iuf":
+            raise ValueError(f"column {name} must be numeric")
+        if values.dtype.kind == "f" and not (np.isfinite(values).all() and (values == np.round(values)).all()):
+            raise ValueError(f"column {name} must hold whole numbers")
+        columns[name] = np.ascontiguousarray(values, dtype=np.int64)
+    if (columns["arrival"] < 0).any() or (columns["burst"] < 1).any():
+        raise ValueError("arrival must be non-negative and burst positive")
+    return ProcessTable.from_buffers(columns["pid"], columns["arrival"], columns["burst"], columns.get("priority"))
+
+
+def jump_to_fault(forward):
+    # Button callback: moves the first row of the memory step table to the next or previous fault.
+    mem = st.session_state.get("mem_result")
+    if not mem:
+        return
+    step = st.session_state.get("mem_step", 1) - 1
+    trace = mem["trace"]
+    if trace is None:
+        return
+    fault = trace.next_fault(step) if forward else trace.previous_fault(step)
+    if fault != -1:
+        st.session_state.mem_step = fault + 1
+
+
+def cached_result(algorithm, params, workload_parts, compute):
+    # Runs compute() unless the same algorithm, parameters and workload were simulated
+    # before, by this session or any other. Cached results are shared; never mutate them.
+    key = ResultCache.key(algorithm, params, *workload_parts)
+    return result_cache().get_or_compute(key, compute)
 
 
 def metric_card(label, value):
@@ -512,6 +592,81 @@ def metric_card(label, value):
     ''', unsafe_allow_html=True)
 
 
+def downsample_timeline(df, max_bars):
+    # Level of detail: segments narrower than one time bin are merged per lane and bin, so the
+    # bar count stays bounded however long the timeline is. Bins mixing processes get PID -1.
+    import pandas as pd
+
+    if len(df) <= max_bars:
+        return df
+    origin = df["Start"].min()
+    bins = max(1, max_bars // (2 * df["Lane"].nunique()))
+    bin_width = max(1, (df["Finish"].max() - origin) / bins)
+    short = (df["Finish"] - df["Start"]) < bin_width
+    small = df[short]
+    merged = small.groupby([small["Lane"], (small["Start"] - origin) // bin_width], sort=False).agg(
+        PID=("PID", "first"), Processes=("PID", "nunique"), Start=("Start", "min"), Finish=("Finish", "max"))
+    merged.loc[merged["Processes"] > 1, "PID"] = -1
+    merged = merged.reset_index(level=0).reset_index(drop=True).drop(columns="Processes")
+    return pd.concat([df[~short], merged], ignore_index=True)
+
+
+def gantt_figure(df, show_lanes):
+    import numpy as np
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    colors = px.colors.qualitative.Vivid
+    pids = df["PID"].to_numpy()
+    start = df["Start"].to_numpy()
+    finish = df["Finish"].to_numpy()
+    codes, uniques = pd.factorize(pids)
+    labels = np.where(pids == -1, "Mixed", np.char.add("P", pids.astype(str)))
+    lanes = np.char.add("Core ", df["Lane"].to_numpy().astype(str)) if show_lanes else np.full(len(df), "Timeline")
+    bar_colors = np.where(pids == -1, "#55607a", np.array(colors)[codes % len(colors)])
+    show_text = len(df) <= 60
+
+    # One trace per process keeps a clickable legend; past that, a single trace carries every bar.
+    if len(uniques) <= 30:
+        groups = [codes == k for k in range(len(uniques))]
+    else:
+        groups = [np.ones(len(df), dtype=bool)]
+
+    fig = go.Figure()
+    for mask in groups:
+        single = len(groups) > 1
+        fig.add_trace(go.Bar(
+            x=finish[mask] - start[mask],
+            y=lanes[mask],
+            base=start[mask],
+            orientation='h',
+            name=labels[mask][0] if single else "Processes",
+            marker_color=bar_colors[mask],
+            marker_line=dict(width=1, color='rgba(0,0,0,0.3)'),
+            text=[f"{t} ({a}-{b})" for t, a, b in zip(labels[mask], start[mask], finish[mask])] if show_text else None,
+            textposition='inside',
+            textfont=dict(color='white', size=11, family='Inter'),
+            showlegend=single,
+            customdata=np.column_stack([labels[mask], finish[mask]]),
+            hovertemplate="<b>%{customdata[0]}</b><br>Start: %{base}ms<br>End: %{customdata[1]}ms<extra></extra>"
+        ))
+
+    fig.update_layout(
+        barmode='overlay',
+        xaxis_title="Time (ms)",
+        yaxis_visible=show_lanes,
+        height=max(160, 60 + 36 * len(set(lanes))),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#8899aa', family='Inter'),
+        margin=dict(l=0, r=0, t=10, b=40),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5, font=dict(size=11)),
+        xaxis=dict(gridcolor='rgba(79,172,254,0.06)', zerolinecolor='rgba(79,172,254,0.06)')
+    )
+    return fig
+
+
 st.markdown('<div class="main-header">💻 Operating System Simulator</div>', unsafe_allow_html=True)
 st.markdown('<div class="subtitle">Semester Project &nbsp;•&nbsp; BSCS &nbsp;•&nbsp; UET Taxila</div>', unsafe_allow_html=True)
 st.markdown("---")
@@ -529,7 +684,7 @@ with st.sidebar:
     st.markdown('<div class="sidebar-nav-label">📌 Modules</div>', unsafe_allow_html=True)
     module = st.radio(
         "Navigation",
-        ["⚙️  CPU Scheduling", "🧠  Memory Management"],
+        ["⚙️  CPU Scheduling", "🧠  Memory Management", "📚  Paging"],
         label_visibility="collapsed"
     )
 
@@ -542,17 +697,37 @@ with st.sidebar:
             <div class="card-body" style="font-size: 0.78rem; line-height: 1.7;">
                 <b style="color:#8bb8f0;">FCFS</b> — First Come, First Served<br>
                 <b style="color:#8bb8f0;">SJF</b> — Shortest Job First<br>
-                <b style="color:#8bb8f0;">RR</b> — Round Robin with time quantum
+                <b style="color:#8bb8f0;">SRTF</b> — Shortest Remaining Time First<br>
+                <b style="color:#8bb8f0;">RR</b> — Round Robin with time quantum<br>
+                <b style="color:#8bb8f0;">MLFQ</b> — Multi-Level Feedback Queue
             </div>
         </div>
         ''', unsafe_allow_html=True)
-    else:
+    elif "Memory" in module:
         st.markdown('''
         <div class="card" style="padding: 16px 18px;">
             <div class="card-title">💡 Quick Info</div>
             <div class="card-body" style="font-size: 0.78rem; line-height: 1.7;">
                 <b style="color:#8bb8f0;">FIFO</b> — First In, First Out<br>
-                <b style="color:#8bb8f0;">LRU</b> — Least Recently Used
+                <b style="color:#8bb8f0;">LRU</b> — Least Recently Used<br>
+                <b style="color:#8bb8f0;">OPT</b> — Optimal (Belady), evicts the page used farthest ahead<br>
+                <b style="color:#8bb8f0;">Clock</b> — Second chance with reference bits<br>
+                <b style="color:#8bb8f0;">LFU</b> — Least Frequently Used<br>
+                <b style="color:#8bb8f0;">ARC</b> — Adaptive Replacement Cache<br>
+                <b style="color:#8bb8f0;">2Q</b> — FIFO probation queue in front of an LRU<br>
+                <b style="color:#8bb8f0;">PFF</b> — Page-fault-frequency, resizes the resident set
+            </div>
+        </div>
+        ''', unsafe_allow_html=True)
+    else:
+        st.markdown('''
+        <div class="card" style="padding: 16px 18px;">
+            <div class="card-title">💡 Quick Info</div>
+            <div class="card-body" style="font-size: 0.78rem; line-height: 1.7;">
+                <b style="color:#8bb8f0;">TLB</b> — LRU cache of page translations<br>
+                <b style="color:#8bb8f0;">Global</b> — A fault may evict any process's page<br>
+                <b style="color:#8bb8f0;">Local</b> — Each process replaces within its own frames<br>
+                <b style="color:#8bb8f0;">EMAT</b> — Effective memory access time
             </div>
         </div>
         ''', unsafe_allow_html=True)
@@ -579,56 +754,86 @@ if "CPU" in module_clean:
             <div class="card-body">Choose algorithm and set parameters</div>
         </div>''', unsafe_allow_html=True)
 
-        algo = st.selectbox("Algorithm", ["FCFS", "SJF (Non-Preemptive)", "Round Robin"],
+        algo = st.selectbox("Algorithm", ["FCFS", "SJF (Non-Preemptive)", "SRTF (Preemptive)", "Round Robin", "MLFQ"],
                             help="Select a CPU scheduling algorithm to simulate")
 
         quantum = 2
+        sweep = False
         if algo == "Round Robin":
-            quantum = st.number_input("Time Quantum", min_value=1, value=2,
-                                      help="Time slice for Round Robin scheduling")
+            sweep = st.checkbox("Quantum Sweep", help="Run Round Robin once per quantum in a range and compare the results")
+            if sweep:
+                s1, s2, s3 = st.columns(3)
+                sweep_min = s1.number_input("From", min_value=1, value=1)
+                sweep_max = s2.number_input("To", min_value=1, value=10)
+                sweep_step = s3.number_input("Step", min_value=1, value=1)
+            else:
+                quantum = st.number_input("Time Quantum", min_value=1, value=2,
+                                          help="Time slice for Round Robin scheduling")
+
+        cores = 1
+        balance = "Global Queue"
+        if algo in ("FCFS", "SJF (Non-Preemptive)", "Round Robin") and not sweep:
+            cores = st.number_input("CPU Cores", min_value=1, max_value=512, value=1,
+                                    help="Simulate a multi-core machine with per-core run queues")
+            if cores > 1:
+                balance = st.selectbox("Load Balancing", ["Global Queue", "Least Loaded", "Work Stealing"],
+                                       help="How processes are spread across the cores")
+
+        gantt_max_bars = st.number_input("Max Gantt Bars", min_value=100, max_value=100000, value=2000, step=100,
+                                         help="Longer timelines are drawn at a lower level of detail, merging very short slices")
+
+        mlfq_quanta = (2, 4, 8)
+        mlfq_boost = 0
+        if algo == "MLFQ":
+            quanta_text = st.text_input("Level Quanta (comma separated)", "2, 4, 8",
+                                        help="Time slice of each queue level, highest priority first")
+            mlfq_boost = st.number_input("Priority Boost Period", min_value=0, value=0,
+                                         help="Move every process back to the top queue this often (0 disables)")
+            try:
+                mlfq_quanta = tuple(int(x.strip()) for x in quanta_text.split(','))
+                if min(mlfq_quanta) < 1:
+                    raise ValueError
+            except ValueError:
+                mlfq_quanta = (2, 4, 8)
+                st.error("⚠️ Level quanta must be positive integers separated by commas. Using 2, 4, 8.")
 
         st.markdown("---")
 
         st.markdown('''<div class="card">
             <div class="card-title">➕ Add Processes</div>
-            <div class="card-body">Add manually or upload a CSV file</div>
+            <div class="card-body">Add manually or upload a CSV, Parquet or Arrow file</div>
         </div>''', unsafe_allow_html=True)
 
-        uploaded_file = st.file_uploader("Upload CSV (pid, arrival, burst)", type="csv",
-                                         help="CSV must have columns: pid, arrival, burst")
+        uploaded_file = st.file_uploader("Upload Workload (pid, arrival, burst)", type=["csv", "parquet", "arrow", "feather"],
+                                         help="CSV, Parquet or Arrow/Feather file with columns: pid, arrival, burst (and optionally priority)")
 
-        if 'processes' not in st.session_state:
-            st.session_state.processes = []
+        if 'workload' not in st.session_state:
+            st.session_state.workload = ProcessTable()
 
-        if uploaded_file is not None:
+        # The uploader keeps its file across reruns; load each upload only once.
+        if uploaded_file is not None and st.session_state.get("loaded_upload") != uploaded_file.file_id:
             try:
-                df_csv = pd.read_csv(uploaded_file)
-                df_csv.columns = [c.strip().lower() for c in df_csv.columns]
-                count_before = len(st.session_state.processes)
-                for _, row in df_csv.iterrows():
-                    st.session_state.processes.append({
-                        "pid": int(row['pid']),
-                        "arrival": int(row['arrival']),
-                        "burst": int(row['burst'])
-                    })
-                added = len(st.session_state.processes) - count_before
-                st.success(f"✅ Loaded {added} processes from CSV!")
+                loaded = read_workload(uploaded_file)
+                st.session_state.workload = st.session_state.workload.concat(loaded)
+                st.session_state.loaded_upload = uploaded_file.file_id
+                st.success(f"✅ Loaded {len(loaded):,} processes from {uploaded_file.name}!")
             except Exception as e:
-                st.error(f"⚠️ CSV Error: {e}. Expected columns: pid, arrival, burst")
+                st.error(f"⚠️ Upload Error: {e}. Expected columns: pid, arrival, burst")
 
         with st.form("add_process"):
             c1, c2, c3 = st.columns(3)
-            pid = c1.number_input("PID", min_value=1, value=len(st.session_state.processes) + 1)
+            pid = c1.number_input("PID", min_value=1, value=len(st.session_state.workload) + 1)
             arr = c2.number_input("Arrival", min_value=0, value=0)
             burst = c3.number_input("Burst", min_value=1, value=5)
             submitted = st.form_submit_button("➕  Add Process")
 
             if submitted:
-                st.session_state.processes.append({"pid": pid, "arrival": arr, "burst": burst})
+                # A new table rather than an in-place append, so earlier runs keep their workload.
+                st.session_state.workload = st.session_state.workload.concat(ProcessTable([pid], [arr], [burst]))
                 st.success(f"✅ Added P{pid}")
 
         if st.button("🗑️  Clear All"):
-            st.session_state.processes = []
+            st.session_state.workload = ProcessTable()
             st.rerun()
 
     with col2:
@@ -637,12 +842,24 @@ if "CPU" in module_clean:
             <div class="card-body">Processes ready for scheduling</div>
         </div>''', unsafe_allow_html=True)
 
-        if st.session_state.processes:
-            df_input = pd.DataFrame(st.session_state.processes)
-            df_input.columns = ["PID", "Arrival Time", "Burst Time"]
+        workload = st.session_state.workload
+        if len(workload):
+            import numpy as np
+            import pandas as pd
+
+            shown = min(len(workload), MAX_QUEUE_ROWS)
+            df_input = pd.DataFrame({
+                "PID": np.frombuffer(workload.pid, dtype=np.int64)[:shown],
+                "Arrival Time": np.frombuffer(workload.arrival_time, dtype=np.int64)[:shown],
+                "Burst Time": np.frombuffer(workload.burst_time, dtype=np.int64)[:shown],
+            }, copy=False)
             st.dataframe(df_input, width='stretch', hide_index=True)
+            if shown < len(workload):
+                st.caption(f"Showing the first {shown:,} of {len(workload):,} processes.")
 
-            chips_html = " ".join([f'<span class="process-chip">P{p["pid"]}</span>' for p in st.session_state.processes])
+            chips_html = " ".join([f'<span class="process-chip">P{p}</span>' for p in workload.pid[:MAX_CHIPS]])
+            if len(workload) > MAX_CHIPS:
+                chips_html += f' <span class="process-chip">+{len(workload) - MAX_CHIPS:,} more</span>'
             st.markdown(f'<div style="margin: 8px 0 16px 0;">{chips_html}</div>', unsafe_allow_html=True)
 
             btn_col1, btn_col2, btn_col3 = st.columns([1, 2, 1])
@@ -650,16 +867,93 @@ if "CPU" in module_clean:
                 run_clicked = st.button("🚀  Run Simulation", type="primary")
 
             if run_clicked:
+                # The inputs of the last run stay in the session so its results survive reruns;
+                # redrawing them is a lookup in the shared result cache.
+                st.session_state.cpu_run = {
+                    "workload": workload,
+                    "algo": algo,
+                    "sweep": range(sweep_min, sweep_max + 1, sweep_step) if sweep else None,
+                    "quantum": quantum,
+                    "cores": cores,
+                    "balance": balance,
+                    "mlfq_quanta": mlfq_quanta,
+                    "mlfq_boost": mlfq_boost,
+                    "gantt_max_bars": gantt_max_bars,
+                }
+            run = st.session_state.get("cpu_run")
+            if run:
+                workload = run["workload"]
+                workload_parts = (workload.pid, workload.arrival_time, workload.burst_time, workload.priority)
+
+            if run and run["sweep"] is not None:
+                with st.spinner("Sweeping quantum values..."):
+                    sweep_rows = cached_result("round_robin_sweep", {"quanta": tuple(run["sweep"])}, workload_parts,
+                                               lambda: CPUScheduler().round_robin_sweep(workload, run["sweep"]))
+
+                st.markdown("---")
+                st.markdown('''<div class="card">
+                    <div class="card-title">🎛️ Quantum Sweep</div>
+                    <div class="card-body">Round Robin performance for each time quantum</div>
+                </div>''', unsafe_allow_html=True)
+
+                if sweep_rows:
+                    import plotly.express as px
+                    import plotly.graph_objects as go
+                    from plotly.subplots import make_subplots
+
+                    df_sweep = pd.DataFrame(sweep_rows)
+                    fig_sweep = make_subplots(rows=2, cols=2, subplot_titles=[
+                        "Avg Waiting (ms)", "Avg Turnaround (ms)", "Throughput (p/ms)", "Context Switches"])
+                    for k, metric in enumerate(["Avg Waiting", "Avg Turnaround", "Throughput", "Context Switches"]):
+                        fig_sweep.add_trace(go.Scatter(
+                            x=df_sweep["Quantum"], y=df_sweep[metric], mode="lines+markers", name=metric,
+                            line=dict(color=px.colors.qualitative.Vivid[k]), showlegend=False
+                        ), row=k // 2 + 1, col=k % 2 + 1)
+                    fig_sweep.update_layout(
+                        height=460,
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='#8899aa', family='Inter'),
+                        margin=dict(l=0, r=0, t=30, b=40)
+                    )
+                    fig_sweep.update_xaxes(title_text="Quantum", gridcolor='rgba(79,172,254,0.06)')
+                    fig_sweep.update_yaxes(gridcolor='rgba(79,172,254,0.06)')
+                    st.plotly_chart(fig_sweep, width='stretch')
+                    st.dataframe(df_sweep, width='stretch', hide_index=True)
+                else:
+                    st.error("⚠️ The quantum range is empty. Make sure 'From' is not greater than 'To'.")
+
+            elif run:
                 with st.spinner("Running simulation..."):
-                    process_objects = [Process(p['pid'], p['arrival'], p['burst']) for p in st.session_state.processes]
                     scheduler = CPUScheduler()
 
-                    if algo == "FCFS":
-                        result_procs, timeline = scheduler.fcfs(process_objects)
-                    elif algo == "SJF (Non-Preemptive)":
-                        result_procs, timeline = scheduler.sjf_non_preemptive(process_objects)
+                    smp_stats = None
+                    tl_core = np.zeros(0, dtype=np.int64)
+                    if run["cores"] > 1:
+                        kernel = {"FCFS": "fcfs", "SJF (Non-Preemptive)": "sjf_non_preemptive", "Round Robin": "round_robin"}[run["algo"]]
+                        policy = {"Global Queue": "global", "Least Loaded": "least_loaded", "Work Stealing": "work_stealing"}[run["balance"]]
+                        smp_quantum = run["quantum"] if kernel == "round_robin" else None
+                        result_procs, timeline_cols, smp_stats = cached_result(
+                            "smp", {"kernel": kernel, "cores": run["cores"], "policy": policy, "quantum": smp_quantum},
+                            workload_parts, lambda: SMPScheduler(run["cores"], policy).run(kernel, workload, smp_quantum))
+                        tl_core, tl_pid, tl_start, tl_finish = (np.frombuffer(c, dtype=np.int64) for c in timeline_cols)
+                    elif run["algo"] == "FCFS":
+                        result_procs, (tl_pid, tl_start, tl_finish) = cached_result(
+                            "fcfs_vectorized", {}, workload_parts, lambda: scheduler.fcfs_vectorized(workload))
                     else:
-                        result_procs, timeline = scheduler.round_robin(process_objects, quantum)
+                        kernel, params = {
+                            "SJF (Non-Preemptive)": ("sjf_non_preemptive", {}),
+                            "SRTF (Preemptive)": ("srtf", {"merge": True}),
+                            "Round Robin": ("round_robin", {"quantum": run["quantum"], "merge": True}),
+                            "MLFQ": ("mlfq", {"quanta": run["mlfq_quanta"], "boost": run["mlfq_boost"] or None, "merge": True}),
+                        }[run["algo"]]
+                        result_procs, (tl_pid, tl_start, tl_finish) = cached_result(
+                            kernel, params, workload_parts, lambda: scheduler.run_compact(kernel, workload, **params))
+                        tl_pid = np.frombuffer(tl_pid, dtype=np.int64)
+                        tl_start = np.frombuffer(tl_start, dtype=np.int64)
+                        tl_finish = np.frombuffer(tl_finish, dtype=np.int64)
+                    df_timeline = pd.DataFrame({"PID": tl_pid, "Start": tl_start, "Finish": tl_finish,
+                                                "Lane": tl_core if smp_stats else 0})
 
                 st.markdown("---")
                 st.markdown('''<div class="card">
@@ -667,50 +961,8 @@ if "CPU" in module_clean:
                     <div class="card-body">Visual timeline of process execution</div>
                 </div>''', unsafe_allow_html=True)
 
-                if timeline:
-                    df_timeline = pd.DataFrame(timeline)
-                    colors = px.colors.qualitative.Vivid
-                    color_map = {}
-                    color_idx = 0
-                    legend_shown = set()
-                    fig = go.Figure()
-
-                    for _, row in df_timeline.iterrows():
-                        task = row['Task']
-                        if task not in color_map:
-                            color_map[task] = colors[color_idx % len(colors)]
-                            color_idx += 1
-
-                        show_legend = task not in legend_shown
-                        legend_shown.add(task)
-
-                        fig.add_trace(go.Bar(
-                            x=[row['Finish'] - row['Start']],
-                            y=["Timeline"],
-                            base=row['Start'],
-                            orientation='h',
-                            name=task,
-                            marker_color=color_map[task],
-                            marker_line=dict(width=1, color='rgba(0,0,0,0.3)'),
-                            text=f"{task} ({row['Start']}-{row['Finish']})",
-                            textposition='inside',
-                            textfont=dict(color='white', size=11, family='Inter'),
-                            showlegend=show_legend,
-                            hovertemplate=f"<b>{task}</b><br>Start: {row['Start']}ms<br>End: {row['Finish']}ms<extra></extra>"
-                        ))
-
-                    fig.update_layout(
-                        barmode='stack',
-                        xaxis_title="Time (ms)",
-                        yaxis_visible=False,
-                        height=160,
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        font=dict(color='#8899aa', family='Inter'),
-                        margin=dict(l=0, r=0, t=10, b=40),
-                        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5, font=dict(size=11)),
-                        xaxis=dict(gridcolor='rgba(79,172,254,0.06)', zerolinecolor='rgba(79,172,254,0.06)')
-                    )
+                if not df_timeline.empty:
+                    fig = gantt_figure(downsample_timeline(df_timeline, run["gantt_max_bars"]), smp_stats is not None)
                     st.plotly_chart(fig, width='stretch')
 
                 st.markdown('''<div class="card">
@@ -718,26 +970,21 @@ if "CPU" in module_clean:
                     <div class="card-body">Detailed scheduling results per process</div>
                 </div>''', unsafe_allow_html=True)
 
-                res_data = []
+                res_data = pd.DataFrame({
+                    label: np.frombuffer(getattr(result_procs, column), dtype=np.int64)
+                    for label, column in [("PID", "pid"), ("Arrival", "arrival_time"), ("Burst", "burst_time"),
+                                          ("Completion", "completion_time"), ("Turnaround", "turnaround_time"),
+                                          ("Waiting", "waiting_time")]
+                }, copy=False)
                 avg_wait = 0
                 avg_turn = 0
-                for p in result_procs:
-                    res_data.append({
-                        "PID": f"P{p.pid}",
-                        "Arrival": p.arrival_time,
-                        "Burst": p.burst_time,
-                        "Completion": p.completion_time,
-                        "Turnaround": p.turnaround_time,
-                        "Waiting": p.waiting_time
-                    })
-                    avg_wait += p.waiting_time
-                    avg_turn += p.turnaround_time
-
-                if result_procs:
-                    avg_wait /= len(result_procs)
-                    avg_turn /= len(result_procs)
-
-                st.dataframe(pd.DataFrame(res_data), width='stretch', hide_index=True)
+
+                if len(result_procs):
+                    avg_wait = sum(result_procs.waiting_time) / len(result_procs)
+                    avg_turn = sum(result_procs.turnaround_time) / len(result_procs)
+
+                st.dataframe(res_data, width='stretch', hide_index=True,
+                             column_config={"PID": st.column_config.NumberColumn(format="P%d")})
 
                 st.markdown("<br>", unsafe_allow_html=True)
                 k1, k2, k3 = st.columns(3)
@@ -746,9 +993,28 @@ if "CPU" in module_clean:
                 with k2:
                     metric_card("Avg Turnaround Time", f"{avg_turn:.2f} ms")
                 with k3:
-                    max_ct = max(p.completion_time for p in result_procs) if result_procs else 1
+                    max_ct = max(result_procs.completion_time) if len(result_procs) else 1
                     throughput = len(result_procs) / max_ct
                     metric_card("Throughput", f"{throughput:.2f} p/ms")
+
+                if smp_stats:
+                    st.markdown("<br>", unsafe_allow_html=True)
+                    st.markdown('''<div class="card">
+                        <div class="card-title">🖥️ Per-Core Utilisation</div>
+                        <div class="card-body">Busy time and utilisation of each core</div>
+                    </div>''', unsafe_allow_html=True)
+                    st.dataframe(pd.DataFrame({
+                        "Core": [f"Core {c}" for c in range(run["cores"])],
+                        "Busy (ms)": smp_stats["Busy"],
+                        "Utilisation": [f"{u * 100:.1f}%" for u in smp_stats["Utilisation"]],
+                    }), width='stretch', hide_index=True)
+                    c1, c2, c3 = st.columns(3)
+                    with c1:
+                        metric_card("Avg Utilisation", f"{sum(smp_stats['Utilisation']) / run['cores'] * 100:.1f}%")
+                    with c2:
+                        metric_card("Migrations", f"{smp_stats['Migrations']}")
+                    with c3:
+                        metric_card("Steals", f"{smp_stats['Steals']}")
         else:
             st.markdown('''
             <div class="card">
@@ -773,16 +1039,52 @@ elif "Memory" in module_clean:
             <div class="card-body">Set up the page replacement algorithm</div>
         </div>''', unsafe_allow_html=True)
 
-        algo_mem = st.selectbox("Algorithm", ["FIFO", "LRU"],
+        algo_mem = st.selectbox("Algorithm", ["FIFO", "LRU", "OPT", "Clock", "LFU", "ARC", "2Q", "PFF"],
                                 help="Select a page replacement algorithm")
         frames = st.number_input("Number of Frames", min_value=1, max_value=10, value=3,
-                                 help="Number of memory frames available")
-        ref_string = st.text_input("Reference String (comma separated)",
-                                   "7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1",
-                                   help="Enter page numbers separated by commas")
+                                 help="Number of memory frames available (PFF sizes its resident set itself)")
+        if algo_mem == "PFF":
+            pff_threshold = st.number_input("PFF Fault Interval", min_value=1, value=5,
+                                            help="A fault more than this many references after the previous one first releases the pages not used in between")
+        ref_source = st.radio("Reference Input", ["Reference String", "Trace File", "Generator"], horizontal=True,
+                              help="Type a short reference string, load a large trace from a file, or generate a seeded synthetic one")
+        if ref_source == "Trace File":
+            trace_fmt = st.selectbox("Trace Format", ["Text", "int32", "int64"],
+                                     help="Text: integers separated by commas or whitespace. int32/int64: raw native-endian page numbers, memory-mapped when read from a path")
+            trace_upload = st.file_uploader("Upload Trace", help="Trace file with page numbers")
+            trace_path = st.text_input("Or Trace Path", "", help="Path of a trace file on the machine running the app; used when nothing is uploaded")
+        elif ref_source == "Generator":
+            gen_pattern = st.selectbox("Pattern", ["Zipf", "Sequential Scan", "Loop", "Phase Changes"],
+                                       help="Zipf: skewed hot set. Sequential Scan: every page once. Loop: a cycle of pages. Phase Changes: the working set moves between phases")
+            g1, g2 = st.columns(2)
+            gen_length = g1.number_input("References", min_value=1, max_value=100_000_000, value=100_000, step=10_000)
+            gen_seed = g2.number_input("Seed", min_value=0, value=42)
+            if gen_pattern == "Zipf":
+                g1, g2 = st.columns(2)
+                gen_pages = g1.number_input("Distinct Pages", min_value=1, max_value=10_000_000, value=1000)
+                gen_alpha = g2.number_input("Exponent", min_value=0.0, max_value=5.0, value=1.0, step=0.1)
+            elif gen_pattern == "Loop":
+                gen_loop = st.number_input("Loop Length", min_value=1, value=frames + 1,
+                                           help="Pages in the cycle; longer than the frame count defeats LRU and FIFO")
+            elif gen_pattern == "Phase Changes":
+                g1, g2, g3 = st.columns(3)
+                gen_pages = g1.number_input("Distinct Pages", min_value=1, max_value=10_000_000, value=1000)
+                gen_phases = g2.number_input("Phases", min_value=1, value=4)
+                gen_ws = g3.number_input("Working Set", min_value=1, value=frames + 2)
+        else:
+            ref_string = st.text_input("Reference String (comma separated)",
+                                       "7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1",
+                                       help="Enter page numbers separated by commas")
+        show_curve = st.checkbox("LRU Fault Curve", help="Show LRU page faults for every frame count (one pass, stack-distance analysis) instead of the pie chart")
+        show_ws = st.checkbox("Working Set Size", help="Plot the working set size W(t, tau) over time")
+        if show_ws:
+            ws_tau = st.number_input("Window (tau)", min_value=1, value=10,
+                                     help="Number of most recent references the working set looks back over")
 
         # Page preview chips
         try:
+            if ref_source != "Reference String":
+                raise ValueError("no preview for trace files or generated traces")
             preview_pages = [int(x.strip()) for x in ref_string.split(',')]
             chips = " ".join([f'<span class="process-chip">{p}</span>' for p in preview_pages])
             st.markdown(f'''<div class="card" style="padding: 16px 20px;">
@@ -799,35 +1101,170 @@ elif "Memory" in module_clean:
             sim_clicked = st.button("🚀  Simulate Memory", type="primary")
 
         if sim_clicked:
+            pages = []
             try:
-                pages = [int(x.strip()) for x in ref_string.split(',')]
+                if ref_source == "Trace File":
+                    if trace_upload is None and not trace_path.strip():
+                        raise ValueError("no trace file given")
+                    if trace_upload is not None:
+                        trace_upload.seek(0)
+                    pages = TraceFile(trace_upload if trace_upload is not None else trace_path.strip(),
+                                      trace_fmt.lower())
+                    if not len(pages):
+                        raise ValueError("trace file is empty")
+                elif ref_source == "Generator":
+                    from algorithms import workloads
+
+                    if gen_pattern == "Zipf":
+                        refs = workloads.zipf(gen_length, gen_pages, gen_alpha, gen_seed)
+                    elif gen_pattern == "Sequential Scan":
+                        refs = workloads.sequential_scan(gen_length)
+                    elif gen_pattern == "Loop":
+                        refs = workloads.loop(gen_length, gen_loop)
+                    else:
+                        refs = workloads.phases(gen_length, gen_pages, gen_phases, min(gen_ws, gen_pages), gen_seed)
+                    pages = memoryview(refs)
+                else:
+                    pages = [int(x.strip()) for x in ref_string.split(',')]
+                if min(pages) < 0:
+                    raise ValueError("page numbers must be non-negative")
                 manager = MemoryManager()
+                n = len(pages)
+                workload_parts = (ResultCache.fingerprint(pages),)
+                # The step table is only recorded for traces it can reasonably show.
+                record = n <= MAX_TRACE_STEPS
 
                 with st.spinner("Simulating..."):
-                    if algo_mem == "FIFO":
-                        faults, snapshots = manager.fifo(pages, frames)
+                    if algo_mem == "PFF":
+                        params = {"threshold": pff_threshold}
+
+                        def simulate():
+                            # The resident set changes size, so PFF is recorded as a ResidentTrace.
+                            allocation = array("l")
+                            trace = ResidentTrace() if record else None
+                            faults, _ = manager.pff(pages, pff_threshold, snapshots=False,
+                                                    allocation=allocation, trace=trace)
+                            return faults, trace, allocation
                     else:
-                        faults, snapshots = manager.lru(pages, frames)
-
-                hits = len(pages) - faults
+                        params = {"frames": frames}
+                        policy = {
+                            "FIFO": manager.fifo,
+                            "LRU": manager.lru,
+                            "OPT": manager.opt,
+                            "Clock": manager.clock,
+                            "LFU": manager.lfu,
+                            "ARC": manager.arc,
+                            "2Q": manager.two_q,
+                        }[algo_mem]
+
+                        def simulate():
+                            trace = PageTrace(frames) if record else None
+                            faults, _ = policy(pages, frames, snapshots=False, trace=trace)
+                            return faults, trace, None
+                    faults, trace, allocation = cached_result(algo_mem, params, workload_parts, simulate)
+
+                    curve = None
+                    if show_curve:
+                        curve = cached_result("lru_fault_curve", {}, workload_parts,
+                                              lambda: manager.lru_fault_curve(pages))
+                    ws_sizes = None
+                    if show_ws:
+                        ws_sizes = cached_result("working_set_sizes", {"tau": ws_tau}, workload_parts,
+                                                 lambda: manager.working_set_sizes(pages, ws_tau))
+
+                # Results are kept in the session so they stay on screen across reruns.
+                st.session_state.mem_result = {
+                    "algo": algo_mem,
+                    "frames": frames,
+                    "references": n,
+                    "faults": faults,
+                    "trace": trace,
+                    "allocation": allocation,
+                    "curve": curve,
+                    "ws_tau": ws_tau if show_ws else None,
+                    "ws_sizes": ws_sizes,
+                }
+                st.session_state.mem_step = 1
+            except ValueError:
+                st.session_state.pop("mem_result", None)
+                if ref_source == "Generator":
+                    st.error("⚠️ Please check the generator parameters.")
+                elif ref_source == "Trace File":
+                    st.error("⚠️ Please provide a non-empty trace of non-negative integers in the selected format.")
+                else:
+                    st.error("⚠️ Please enter a valid comma-separated list of non-negative integers for the reference string.")
+            except OSError as e:
+                st.session_state.pop("mem_result", None)
+                st.error(f"⚠️ Could not read the trace file: {e}")
+            finally:
+                if isinstance(pages, TraceFile):
+                    pages.close()
+
+        mem = st.session_state.get("mem_result")
+        if mem:
+            import pandas as pd
+            import plotly.express as px
+            import plotly.graph_objects as go
+
+            faults, trace, allocation = mem["faults"], mem["trace"], mem["allocation"]
+            hits = mem["references"] - faults
+
+            # Summary Metrics
+            st.markdown(f'''<div class="card">
+                <div class="card-title">📊 Results Summary</div>
+                <div class="card-body">Performance of the {mem['algo']} algorithm</div>
+            </div>''', unsafe_allow_html=True)
 
-                # Summary Metrics
-                st.markdown(f'''<div class="card">
-                    <div class="card-title">📊 Results Summary</div>
-                    <div class="card-body">Performance of the {algo_mem} algorithm</div>
+            metric_cols = st.columns(3 if allocation is None else 4)
+            with metric_cols[0]:
+                metric_card("Page Faults", f"{faults}")
+            with metric_cols[1]:
+                metric_card("Page Hits", f"{hits}")
+            with metric_cols[2]:
+                hit_ratio = hits / mem["references"] * 100 if mem["references"] else 0
+                metric_card("Hit Ratio", f"{hit_ratio:.1f}%")
+            if allocation is not None:
+                with metric_cols[3]:
+                    avg_frames = sum(allocation) / len(allocation) if allocation else 0
+                    metric_card("Avg Frames", f"{avg_frames:.1f}")
+
+            st.markdown("<br>", unsafe_allow_html=True)
+
+            if mem["curve"] is not None:
+                # Fault Curve
+                st.markdown('''<div class="card">
+                    <div class="card-title">📉 LRU Faults vs Frames</div>
+                    <div class="card-body">Page faults LRU would incur with every frame count, from one pass over the reference string</div>
                 </div>''', unsafe_allow_html=True)
 
-                m1, m2, m3 = st.columns(3)
-                with m1:
-                    metric_card("Page Faults", f"{faults}")
-                with m2:
-                    metric_card("Page Hits", f"{hits}")
-                with m3:
-                    hit_ratio = hits / len(pages) * 100 if pages else 0
-                    metric_card("Hit Ratio", f"{hit_ratio:.1f}%")
-
-                st.markdown("<br>", unsafe_allow_html=True)
-
+                curve = mem["curve"]
+                # Plot at most ~2000 points (markers only when they can be told apart), always
+                # including the last frame count.
+                stride = max(1, len(curve) // 2000)
+                curve_frames = list(range(1, len(curve) + 1, stride))
+                if curve_frames and curve_frames[-1] != len(curve):
+                    curve_frames.append(len(curve))
+                fig_curve = go.Figure(go.Scatter(
+                    x=curve_frames, y=[curve[k - 1] for k in curve_frames],
+                    mode="lines+markers" if len(curve_frames) <= 200 else "lines",
+                    line=dict(color="#4facfe"), name="LRU faults",
+                    hovertemplate="%{x} frames: %{y} faults<extra></extra>"
+                ))
+                if mem["frames"] <= len(curve):
+                    fig_curve.add_vline(x=mem["frames"], line_dash="dash", line_color="#00f260")
+                fig_curve.update_layout(
+                    xaxis_title="Frames",
+                    yaxis_title="Page Faults",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='#8899aa', family='Inter'),
+                    height=280,
+                    margin=dict(l=20, r=20, t=10, b=10),
+                    xaxis=dict(gridcolor='rgba(79,172,254,0.06)'),
+                    yaxis=dict(gridcolor='rgba(79,172,254,0.06)')
+                )
+                st.plotly_chart(fig_curve, width='stretch')
+            else:
                 # Pie Chart
                 st.markdown('''<div class="card">
                     <div class="card-title">📉 Fault vs Hit Analysis</div>
@@ -850,21 +1287,74 @@ elif "Memory" in module_clean:
                 fig_pie.update_traces(textinfo='percent+label', textfont_size=13, textfont_family='Inter')
                 st.plotly_chart(fig_pie, width='stretch')
 
-                # Step-by-Step Table
-                st.markdown('''<div class="card">
-                    <div class="card-title">🔄 Step-by-Step Execution</div>
-                    <div class="card-body">Memory frame state at each page request</div>
+            if mem["ws_sizes"] is not None:
+                # Working Set Size
+                st.markdown(f'''<div class="card">
+                    <div class="card-title">📈 Working Set Size</div>
+                    <div class="card-body">Distinct pages among the last {mem['ws_tau']} references at every step</div>
                 </div>''', unsafe_allow_html=True)
 
+                ws_sizes = mem["ws_sizes"]
+                # Plot at most ~2000 points however long the trace is.
+                stride = max(1, len(ws_sizes) // 2000)
+                ws_steps = list(range(1, len(ws_sizes) + 1, stride))
+                fig_ws = go.Figure(go.Scatter(
+                    x=ws_steps, y=list(ws_sizes[::stride]), mode="lines",
+                    line=dict(color="#4facfe"), name=f"W(t, {mem['ws_tau']})",
+                    hovertemplate="Step %{x}: %{y} pages<extra></extra>"
+                ))
+                if allocation is not None:
+                    fig_ws.add_trace(go.Scatter(
+                        x=ws_steps, y=list(allocation[::stride]), mode="lines",
+                        line=dict(color="#00f260", dash="dot"), name="PFF frames",
+                        hovertemplate="Step %{x}: %{y} frames<extra></extra>"
+                    ))
+                fig_ws.update_layout(
+                    xaxis_title="Step",
+                    yaxis_title="Pages",
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='#8899aa', family='Inter'),
+                    height=280,
+                    margin=dict(l=20, r=20, t=10, b=10),
+                    legend=dict(orientation="h", yanchor="bottom", y=1.0, xanchor="right", x=1.0),
+                    xaxis=dict(gridcolor='rgba(79,172,254,0.06)'),
+                    yaxis=dict(gridcolor='rgba(79,172,254,0.06)')
+                )
+                st.plotly_chart(fig_ws, width='stretch')
+
+            # Step-by-Step Table
+            st.markdown('''<div class="card">
+                <div class="card-title">🔄 Step-by-Step Execution</div>
+                <div class="card-body">Memory frame state at each page request</div>
+            </div>''', unsafe_allow_html=True)
+
+            if trace is None:
+                st.info(f"The trace has {mem['references']:,} references; the step-by-step table is only shown for up to {MAX_TRACE_STEPS:,}.")
+            else:
+                # Only the visible window of steps is materialised and styled.
+                total = len(trace)
+                n1, n2, n3 = st.columns(3)
+                page_size = n1.selectbox("Rows per Page", [25, 50, 100, 250], index=1, key="mem_page_size")
+                with n2:
+                    st.button("⏮  Previous Fault", on_click=jump_to_fault, args=(False,))
+                with n3:
+                    st.button("Next Fault  ⏭", on_click=jump_to_fault, args=(True,))
+                if total > 1:
+                    st.slider("Step", min_value=1, max_value=total, key="mem_step",
+                              help="First step shown in the table")
+                start = min(st.session_state.get("mem_step", 1), total) - 1
+                stop = min(start + page_size, total)
+
                 display_data = []
-                for i, step in enumerate(snapshots):
-                    frames_display = step['Frames'] + ['-'] * (frames - len(step['Frames']))
-                    row = {"Step": i + 1, "Page": step['Page'], "Status": step['Status']}
-                    for j, f in enumerate(frames_display):
-                        row[f"Frame {j + 1}"] = f
+                for i, page, status, frame_slots in trace.rows(start, stop, MAX_FRAME_COLUMNS):
+                    row = {"Step": i + 1, "Page": page, "Status": status}
+                    for j, f in enumerate(frame_slots):
+                        row[f"Frame {j + 1}"] = str(f) if f is not None else '-'
                     display_data.append(row)
 
-                df_mem = pd.DataFrame(display_data)
+                # PFF rows differ in frame count; pad the shorter ones.
+                df_mem = pd.DataFrame(display_data).fillna('-')
 
                 def color_status(val):
                     if val == 'Miss':
@@ -878,10 +1368,10 @@ elif "Memory" in module_clean:
                     width='stretch',
                     hide_index=True
                 )
-
-            except ValueError:
-                st.error("⚠️ Please enter a valid comma-separated list of integers for the reference string.")
-        else:
+                st.caption(f"Steps {start + 1:,}–{stop:,} of {total:,}")
+                if allocation is not None and max(allocation[start:stop]) > MAX_FRAME_COLUMNS:
+                    st.caption(f"Resident sets are cut to their {MAX_FRAME_COLUMNS} least recently used pages.")
+        elif not sim_clicked:
             st.markdown('''
             <div class="card">
                 <div class="empty-state">
@@ -890,3 +1380,145 @@ elif "Memory" in module_clean:
                 </div>
             </div>
             ''', unsafe_allow_html=True)
+
+
+# ================= PAGING MODULE =================
+else:
+    st.markdown('<div class="sub-header">📚 Multi-Process Paging Simulator</div>', unsafe_allow_html=True)
+
+    col1, col2 = st.columns([1, 2], gap="large")
+
+    with col1:
+        # Configuration Card
+        st.markdown('''<div class="card">
+            <div class="card-title">🔧 Configuration</div>
+            <div class="card-body">Processes share physical frames behind per-process page tables and a TLB</div>
+        </div>''', unsafe_allow_html=True)
+
+        p1, p2 = st.columns(2)
+        pg_frames = p1.number_input("Physical Frames", min_value=1, max_value=1_000_000, value=64)
+        pg_tlb = p2.number_input("TLB Entries", min_value=0, max_value=4096, value=16)
+        p1, p2 = st.columns(2)
+        pg_scope = p1.selectbox("Replacement Scope", ["Global", "Local"],
+                                help="Global: a fault may evict any process's page. Local: frames are split evenly and each process replaces only its own")
+        pg_algo = p2.selectbox("Replacement", ["LRU", "FIFO"])
+        t1, t2, t3 = st.columns(3)
+        pg_tlb_time = t1.number_input("TLB (ns)", min_value=0, value=1)
+        pg_mem_time = t2.number_input("Memory (ns)", min_value=1, value=100)
+        pg_fault_time = t3.number_input("Fault (ms)", min_value=0.0, value=8.0, step=0.5)
+
+        pg_source = st.radio("Trace Input", ["Reference List", "Generator"], horizontal=True,
+                             help="Type pid:page references, or generate an interleaved multi-process trace")
+        if pg_source == "Generator":
+            g1, g2 = st.columns(2)
+            pg_length = g1.number_input("References", min_value=1, max_value=100_000_000, value=1_000_000, step=100_000)
+            pg_procs = g2.number_input("Processes", min_value=1, max_value=256, value=4)
+            g1, g2, g3 = st.columns(3)
+            pg_pages = g1.number_input("Pages / Process", min_value=1, max_value=10_000_000, value=256)
+            pg_slice = g2.number_input("Time Slice", min_value=1, value=100,
+                                       help="References a process makes before the next context switch")
+            pg_seed = g3.number_input("Seed", min_value=0, value=42)
+        else:
+            pg_refs = st.text_area("References (pid:page, comma separated)",
+                                   "1:0, 1:1, 2:0, 2:1, 1:0, 1:2, 2:2, 2:0, 1:1, 1:0, 2:3, 2:1, 1:3, 1:0, 2:0",
+                                   help="Each entry is a process id and a page number")
+
+    with col2:
+        # Centered Simulate button
+        btn_col1, btn_col2, btn_col3 = st.columns([1, 2, 1])
+        with btn_col2:
+            paging_clicked = st.button("🚀  Simulate Paging", type="primary")
+
+        if paging_clicked:
+            parsed = False
+            try:
+                if pg_source == "Generator":
+                    from algorithms import workloads
+
+                    pids, pages = workloads.interleaved(pg_length, pg_procs, pg_pages, time_slice=pg_slice, seed=pg_seed)
+                    pids, pages = memoryview(pids), memoryview(pages)
+                else:
+                    pairs = [entry.split(":") for entry in pg_refs.split(",") if entry.strip()]
+                    pids = [int(pid) for pid, _ in pairs]
+                    pages = [int(page) for _, page in pairs]
+                    if not pages or min(pages) < 0:
+                        raise ValueError("page numbers must be non-negative")
+                parsed = True
+
+                system = PagingSystem(pg_frames, pg_tlb, pg_scope.lower(), pg_algo.lower(),
+                                      tlb_time=pg_tlb_time, memory_time=pg_mem_time,
+                                      fault_time=pg_fault_time * 1_000_000)
+                with st.spinner("Simulating..."):
+                    params = {"frames": pg_frames, "tlb": pg_tlb, "scope": system.scope, "algorithm": system.algorithm,
+                              "times": (pg_tlb_time, pg_mem_time, pg_fault_time)}
+                    proc_rows, pg_stats = cached_result("paging", params, (pids, pages), lambda: system.run(pids, pages))
+                # Results are kept in the session so they stay on screen across reruns.
+                st.session_state.paging_result = {"rows": proc_rows, "stats": pg_stats,
+                                                  "label": f"{pg_scope.lower()} {pg_algo}"}
+            except ValueError as e:
+                st.session_state.pop("paging_result", None)
+                if parsed or pg_source == "Generator":
+                    st.error(f"⚠️ {e}")
+                else:
+                    st.error("⚠️ Please enter a comma-separated list of pid:page pairs with non-negative page numbers.")
+
+        paging = st.session_state.get("paging_result")
+        if paging:
+            import pandas as pd
+            import plotly.graph_objects as go
+
+            proc_rows, pg_stats = paging["rows"], paging["stats"]
+
+            # Summary Metrics
+            st.markdown(f'''<div class="card">
+                <div class="card-title">📊 Results Summary</div>
+                <div class="card-body">{pg_stats["References"]:,} references, {paging["label"]} replacement</div>
+            </div>''', unsafe_allow_html=True)
+
+            m1, m2, m3, m4 = st.columns(4)
+            with m1:
+                metric_card("Page Faults", f"{pg_stats['Page Faults']}")
+            with m2:
+                metric_card("Fault Rate", f"{pg_stats['Fault Rate'] * 100:.2f}%")
+            with m3:
+                metric_card("TLB Hit Ratio", f"{pg_stats['TLB Hit Ratio'] * 100:.1f}%")
+            with m4:
+                metric_card("EMAT", f"{pg_stats['EMAT']:,.1f} ns")
+
+            st.markdown("<br>", unsafe_allow_html=True)
+
+            # Per-Process Fault Rates
+            st.markdown('''<div class="card">
+                <div class="card-title">🧩 Per-Process Fault Rates</div>
+                <div class="card-body">Faults per reference and resident pages of every process at the end of the trace</div>
+            </div>''', unsafe_allow_html=True)
+
+            df_procs = pd.DataFrame(proc_rows)
+            fig_procs = go.Figure(go.Bar(
+                x=[f"P{pid}" for pid in df_procs["PID"]], y=df_procs["Fault Rate"] * 100,
+                marker_color="#4facfe", hovertemplate="%{x}: %{y:.2f}%<extra></extra>"
+            ))
+            fig_procs.update_layout(
+                yaxis_title="Fault Rate (%)",
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='#8899aa', family='Inter'),
+                height=280,
+                margin=dict(l=20, r=20, t=10, b=10),
+                yaxis=dict(gridcolor='rgba(79,172,254,0.06)')
+            )
+            st.plotly_chart(fig_procs, width='stretch')
+            st.dataframe(df_procs, width='stretch', hide_index=True,
+                         column_config={
+                             "PID": st.column_config.NumberColumn(format="P%d"),
+                             "Fault Rate": st.column_config.NumberColumn(format="percent"),
+                         })
+        elif not paging_clicked:
+            st.markdown('''
+            <div class="card">
+                <div class="empty-state">
+                    <div class="empty-state-icon">📚</div>
+                    <div class="empty-state-text">Configure parameters on the left and click<br><b>Simulate Paging</b> to begin.</div>
+                </div>
+            </div>
+            ''', unsafe_allow_html=True)
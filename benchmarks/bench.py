@@ -0,0 +1,152 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.cpu import CPUScheduler, ProcessTable
+from algorithms.memory import MemoryManager, PageTrace
+
+DEFAULT_SIZES = [10 ** k for k in range(2, 7)]
+
+
+def make_processes(n, seed):
+    rng = random.Random(seed)
+    return ProcessTable(range(1, n + 1),
+                        [rng.randrange(n) for _ in range(n)],
+                        [rng.randint(1, 20) for _ in range(n)])
+
+
+def make_pages(n, seed):
+    # 80% of references go to a small hot set, the rest are spread over a larger range.
+    rng = random.Random(seed)
+    return [rng.randrange(16) if rng.random() < 0.8 else rng.randrange(1024) for _ in range(n)]
+
+
+CPU_CASES = {
+    "fcfs": lambda t: CPUScheduler().fcfs(t),
+    "fcfs_vectorized": lambda t: CPUScheduler().fcfs_vectorized(t),
+    "sjf_non_preemptive": lambda t: CPUScheduler().sjf_non_preemptive(t),
+    "round_robin": lambda t: CPUScheduler().round_robin(t, 4, merge=True),
+    "srtf": lambda t: CPUScheduler().srtf(t, merge=True),
+    "mlfq": lambda t: CPUScheduler().mlfq(t, merge=True),
+}
+
+# Per-step snapshot dicts would dominate both time and peak memory, so the policies run
+# without them; the *_traced cases add the compact PageTrace the app records.
+MEMORY_CASES = {
+    "fifo": lambda pages: MemoryManager().fifo(pages, 8, snapshots=False),
+    "lru": lambda pages: MemoryManager().lru(pages, 8, snapshots=False),
+    "opt": lambda pages: MemoryManager().opt(pages, 8, snapshots=False),
+    "clock": lambda pages: MemoryManager().clock(pages, 8, snapshots=False),
+    "lfu": lambda pages: MemoryManager().lfu(pages, 8, snapshots=False),
+    "arc": lambda pages: MemoryManager().arc(pages, 8, snapshots=False),
+    "two_q": lambda pages: MemoryManager().two_q(pages, 8, snapshots=False),
+    "lru_traced": lambda pages: MemoryManager().lru(pages, 8, snapshots=False, trace=PageTrace(8)),
+    "opt_traced": lambda pages: MemoryManager().opt(pages, 8, snapshots=False, trace=PageTrace(8)),
+}
+
+
+def measure(fn, workload, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(workload)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(workload)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(sizes, seed, repeat, only):
+    results = []
+    for suite, cases, make in (("cpu", CPU_CASES, make_processes), ("memory", MEMORY_CASES, make_pages)):
+        for size in sizes:
+            workload = make(size, seed)
+            for name, fn in cases.items():
+                if only and name not in only:
+                    continue
+                try:
+                    wall, peak = measure(fn, workload, repeat)
+                except ImportError as e:
+                    print(f"skip {name}: {e}", file=sys.stderr)
+                    continue
+                row = {
+                    "suite": suite,
+                    "algorithm": name,
+                    "size": size,
+                    "wall_s": wall,
+                    "peak_bytes": peak,
+                    "ops_per_s": size / wall if wall else None,
+                }
+                results.append(row)
+                print(f"{suite:<7} {name:<20} {size:>9}  {wall:9.4f} s  {peak / 2 ** 20:9.2f} MiB  {row['ops_per_s'] or 0:14,.0f} ops/s")
+    return results
+
+
+def compare(results, baseline, tolerance, min_time, min_bytes):
+    base = {(r["suite"], r["algorithm"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"\n{'algorithm':<20} {'size':>9} {'time x':>8} {'memory x':>9}")
+    for r in results:
+        old = base.get((r["suite"], r["algorithm"], r["size"]))
+        if old is None:
+            continue
+        time_ratio = r["wall_s"] / old["wall_s"] if old["wall_s"] else 1.0
+        mem_ratio = r["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else 1.0
+        flag = ""
+        slower = time_ratio > 1 + tolerance and r["wall_s"] >= min_time
+        larger = mem_ratio > 1 + tolerance and r["peak_bytes"] >= min_bytes
+        if slower or larger:
+            flag = "  REGRESSION"
+            regressions.append(r)
+        print(f"{r['algorithm']:<20} {r['size']:>9} {time_ratio:8.2f} {mem_ratio:9.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark CPUScheduler and MemoryManager scaling.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="workload sizes (processes or page references)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case; the best is kept")
+    parser.add_argument("--only", nargs="+", help="run only these algorithms")
+    parser.add_argument("--output", default="benchmarks/results.json")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown or memory growth before a case counts as a regression")
+    parser.add_argument("--min-time", type=float, default=0.01,
+                        help="cases faster than this many seconds are too noisy to flag as slower")
+    parser.add_argument("--min-bytes", type=int, default=64 * 1024,
+                        help="peaks below this many bytes are too small to flag as memory growth")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.seed, args.repeat, set(args.only or ()))
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {len(results)} results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance, args.min_time, args.min_bytes):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import argparse
+import compileall
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the CLI and its worker processes import; each must load with the standard library only.
+MODULES = ["algorithms.cpu", "algorithms.memory", "algorithms.smp", "algorithms.paging",
+           "algorithms.cache", "algorithms.__main__"]
+HEAVY = ("streamlit", "plotly", "pandas", "numpy", "pyarrow")
+
+
+def import_time(module):
+    # Cumulative import time of `module` in a fresh interpreter, from `python -X importtime`,
+    # and every top-level package that import pulled in.
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr}")
+    total = None
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        loaded.add(name.split(".")[0])
+        if name == module:
+            total = int(cumulative) / 1000
+    return total, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the cold import time of the algorithms package.")
+    parser.add_argument("--budget-ms", type=float, default=15.0, help="allowed cumulative import time per module")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module; the best is kept")
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    args = parser.parse_args(argv)
+
+    # Measure imports from up-to-date bytecode; with PYTHONDONTWRITEBYTECODE set nothing else
+    # would write it, and compiling the sources would dominate the timings.
+    compileall.compile_dir(os.path.join(ROOT, "algorithms"), quiet=1)
+    failed = False
+    for module in args.modules:
+        best = float("inf")
+        for _ in range(args.repeat):
+            ms, loaded = import_time(module)
+            best = min(best, ms)
+        heavy = sorted(loaded.intersection(HEAVY))
+        flag = ""
+        if best > args.budget_ms or heavy:
+            flag = "  OVER BUDGET" if not heavy else f"  IMPORTS {', '.join(heavy)}"
+            failed = True
+        print(f"{module:<22} {best:8.2f} ms{flag}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
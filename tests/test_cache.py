@@ -0,0 +1,55 @@
+import io
+from array import array
+
+from algorithms.cache import ResultCache
+from algorithms.memory import TraceFile
+
+
+def fill(cache, keys, value=lambda key: key):
+    calls = []
+    for key in keys:
+        cache.get_or_compute(key, lambda: calls.append(key) or value(key))
+    return calls
+
+
+def test_least_recently_used_entry_goes_first():
+    cache = ResultCache(max_entries=2)
+    assert fill(cache, ["a", "b", "a", "c"]) == ["a", "b", "c"]
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_entries_are_evicted_by_size():
+    size = ResultCache.sizeof(bytes(1000))
+    cache = ResultCache(max_entries=10, max_bytes=2 * size + 10)
+    fill(cache, ["a", "b", "c"], lambda key: bytes(1000))
+    assert len(cache) == 2 and "a" not in cache
+    assert cache.bytes == 2 * size
+    cache.clear()
+    assert len(cache) == 0 and cache.bytes == 0
+
+
+def test_result_bigger_than_the_cache_is_not_stored():
+    cache = ResultCache(max_bytes=1000)
+    fill(cache, ["small"], lambda key: bytes(10))
+    assert fill(cache, ["big", "big"], lambda key: bytes(5000)) == ["big", "big"]
+    assert "big" not in cache and "small" in cache
+
+
+def test_sizeof_counts_buffers_and_shared_objects_once():
+    column = array("q", range(1000))
+    assert ResultCache.sizeof([column, column]) < 2 * column.itemsize * len(column)
+    assert ResultCache.sizeof(memoryview(column)) == column.itemsize * len(column)
+
+
+def test_fingerprint_tells_element_types_apart():
+    pages = array("q", [1, 2, 3])
+    same_bytes = array("i", pages.tobytes())
+    assert ResultCache.fingerprint(pages) != ResultCache.fingerprint(same_bytes)
+    assert ResultCache.fingerprint(pages) == ResultCache.fingerprint([1, 2, 3])
+    assert ResultCache.fingerprint(pages) != ResultCache.fingerprint(array("q", [1, 2]), array("q", [3]))
+
+    raw = array("i", [7, 0, 7, 1]).tobytes()
+    with TraceFile(io.BytesIO(raw), "int32") as as_int32, TraceFile(io.BytesIO(raw), "int64") as as_int64:
+        assert ResultCache.fingerprint(as_int32) != ResultCache.fingerprint(as_int64)
+        assert ResultCache.key("lru", {"frames": 3}, as_int32) != ResultCache.key("lru", {"frames": 3}, as_int64)
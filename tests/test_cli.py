@@ -0,0 +1,56 @@
+import csv
+import json
+
+from algorithms.__main__ import main
+from algorithms.cpu import CPUScheduler, Process
+from algorithms.memory import MemoryManager
+
+ROWS = [(1, 0, 5), (2, 1, 3), (3, 2, 8), (4, 12, 2)]
+PAGES = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2]
+
+
+def write_inputs(tmp_path):
+    workload = tmp_path / "workload.csv"
+    workload.write_text("pid,arrival,burst\n" + "".join(f"{p},{a},{b}\n" for p, a, b in ROWS))
+    trace = tmp_path / "trace.txt"
+    trace.write_text(", ".join(map(str, PAGES)) + "\n")
+    return str(workload), str(trace)
+
+
+def test_cpu_rows_as_jsonl(tmp_path):
+    workload, _ = write_inputs(tmp_path)
+    output = tmp_path / "out.jsonl"
+    assert main(["cpu", "fcfs", "sjf_non_preemptive", "-i", workload, "-o", str(output), "-j", "1"]) == 0
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [row["algorithm"] for row in rows] == ["fcfs", "sjf_non_preemptive"]
+    for row in rows:
+        procs, _ = getattr(CPUScheduler(), row["algorithm"])([Process(*r) for r in ROWS])
+        assert row["file"] == workload and row["processes"] == len(ROWS)
+        assert row["avg_waiting"] == sum(p.waiting_time for p in procs) / len(ROWS)
+        assert row["makespan"] == max(p.completion_time for p in procs)
+
+
+def test_memory_rows_as_csv(tmp_path):
+    _, trace = write_inputs(tmp_path)
+    output = tmp_path / "out.csv"
+    assert main(["memory", "fifo", "lru", "pff", "-i", trace, "-o", str(output), "-j", "1", "--frames", "3"]) == 0
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["algorithm"] for row in rows] == ["fifo", "lru", "pff"]
+    manager = MemoryManager()
+    assert int(rows[0]["faults"]) == manager.fifo(PAGES, 3)[0]
+    assert int(rows[1]["faults"]) == manager.lru(PAGES, 3)[0]
+    assert int(rows[2]["faults"]) == manager.pff(PAGES, 10)[0]
+    assert all(int(row["references"]) == len(PAGES) for row in rows)
+    # PFF rows carry a threshold and no frame count; the other rows leave it blank.
+    assert rows[0]["threshold"] == "" and rows[2]["frames"] == ""
+
+
+def test_missing_input_fails_but_keeps_other_rows(tmp_path, capsys):
+    _, trace = write_inputs(tmp_path)
+    missing = str(tmp_path / "missing.txt")
+    output = tmp_path / "out.jsonl"
+    assert main(["memory", "lru", "-i", trace, missing, "-o", str(output), "-j", "1"]) == 1
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [row["file"] for row in rows] == [trace]
+    assert missing in capsys.readouterr().err
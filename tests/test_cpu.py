@@ -0,0 +1,234 @@
+import gc
+import random
+import time
+from array import array
+from collections import deque
+
+import pytest
+
+from algorithms.cpu import CPUScheduler, Process, ProcessTable
+
+
+def random_rows(rng, max_n=40):
+    # Few distinct arrivals and bursts, so ties are common.
+    n = rng.randint(0, max_n)
+    return [(k + 1, rng.randint(0, 30), rng.randint(1, 6)) for k in range(n)]
+
+
+def as_table(rows):
+    return ProcessTable([r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows])
+
+
+def baseline_sjf(rows):
+    # The original list scan: at every dispatch, the shortest burst among the arrived
+    # processes, the first one in arrival order on ties.
+    remaining = sorted(rows, key=lambda r: r[1])
+    current_time = 0
+    runs = []
+    while remaining:
+        available = [r for r in remaining if r[1] <= current_time]
+        if not available:
+            current_time = min(r[1] for r in remaining)
+            continue
+        shortest = min(available, key=lambda r: r[2])
+        runs.append((shortest[0], current_time, current_time + shortest[2]))
+        current_time += shortest[2]
+        remaining.remove(shortest)
+    return runs
+
+
+def test_sjf_matches_list_scan():
+    rng = random.Random(1)
+    for _ in range(300):
+        rows = random_rows(rng)
+        expected = baseline_sjf(rows)
+
+        procs, timeline = CPUScheduler().sjf_non_preemptive([Process(*r) for r in rows])
+        assert [(p.pid, p.start_time, p.completion_time) for p in procs] == expected
+        assert [(int(d["Task"][1:]), d["Start"], d["Finish"]) for d in timeline] == expected
+
+        table, _ = CPUScheduler().run_compact("sjf_non_preemptive", as_table(rows))
+        assert list(zip(table.pid, table.start_time, table.completion_time)) == expected
+
+
+def best_times(fns, repeat=5):
+    # Runs alternate between the cases, so a burst of load on the machine hits all of them,
+    # and the cyclic garbage collector is paused so its passes do not land in one case only.
+    best = [float("inf")] * len(fns)
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for k, fn in enumerate(fns):
+                start = time.perf_counter()
+                fn()
+                best[k] = min(best[k], time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def test_sjf_scales_near_linearithmically():
+    # Arrivals spread over [0, n) with a mean burst of 25 keep most processes waiting, so
+    # the ready set grows with n: quadrupling n costs ~4-6x with a heap and ~16x with a list
+    # scan, a gap wide enough to survive a noisy machine.
+    def workload(n):
+        rng = random.Random(n)
+        return ProcessTable(range(n), [rng.randrange(n) for _ in range(n)], [rng.randint(1, 50) for _ in range(n)])
+
+    small, large = workload(10_000), workload(40_000)
+    scheduler = CPUScheduler()
+    small_time, large_time = best_times([lambda: scheduler.run_compact("sjf_non_preemptive", small),
+                                         lambda: scheduler.run_compact("sjf_non_preemptive", large)])
+    assert large_time / small_time < 10
+
+
+def unit_step_srtf(rows):
+    # Advances one time unit at a time, always running the arrived process with the least
+    # remaining time (ties: earliest arrival, then input order among equal arrivals).
+    rows = sorted(rows, key=lambda r: r[1])
+    remaining = [r[2] for r in rows]
+    completion = {}
+    segments = []
+    t = 0
+    while len(completion) < len(rows):
+        ready = [k for k in range(len(rows)) if rows[k][1] <= t and remaining[k]]
+        if not ready:
+            t += 1
+            continue
+        k = min(ready, key=lambda k: (remaining[k], rows[k][1], k))
+        extend_segment(segments, rows[k][0], t)
+        remaining[k] -= 1
+        t += 1
+        if not remaining[k]:
+            completion[rows[k][0]] = t
+    return sorted(completion.items()), segments
+
+
+def unit_step_mlfq(rows, quanta, boost):
+    # Round Robin per level with quantum quanta[level]; a process that uses up its quantum
+    # drops one level, one preempted by a higher level keeps its place at the head of its
+    # own, and every `boost` time units all processes return to level 0.
+    rows = sorted(rows, key=lambda r: r[1])
+    n = len(rows)
+    remaining = [r[2] for r in rows]
+    level = [0] * n
+    used = [0] * n
+    queues = [deque() for _ in quanta]
+    completion = {}
+    segments = []
+    running = None
+    next_boost = boost
+    t = 0
+    i = 0
+
+    def admit():
+        nonlocal i
+        while i < n and rows[i][1] <= t:
+            queues[0].append(i)
+            i += 1
+
+    while len(completion) < n:
+        admit()
+        if running is None:
+            running = next((q.popleft() for q in queues if q), None)
+        if running is None:
+            t += 1
+            if boost:
+                while next_boost <= t:
+                    next_boost += boost
+            continue
+        k = running
+        extend_segment(segments, rows[k][0], t)
+        remaining[k] -= 1
+        used[k] += 1
+        t += 1
+        admit()
+        if not remaining[k]:
+            completion[rows[k][0]] = t
+            running = None
+        elif used[k] >= quanta[level[k]]:
+            level[k] = min(level[k] + 1, len(quanta) - 1)
+            used[k] = 0
+            queues[level[k]].append(k)
+            running = None
+        elif any(queues[:level[k]]) or (boost and t >= next_boost):
+            queues[level[k]].appendleft(k)
+            running = None
+        if boost and t >= next_boost:
+            while next_boost <= t:
+                next_boost += boost
+            merged = deque()
+            for q in queues:
+                merged.extend(q)
+                q.clear()
+            for k in merged:
+                level[k] = used[k] = 0
+            if running is not None:
+                level[running] = used[running] = 0
+            queues[0] = merged
+    return sorted(completion.items()), segments
+
+
+def extend_segment(segments, pid, t):
+    if segments and segments[-1][0] == pid and segments[-1][2] == t:
+        segments[-1] = (pid, segments[-1][1], t + 1)
+    else:
+        segments.append((pid, t, t + 1))
+
+
+def run_merged(method, rows, **params):
+    procs, timeline = method([Process(*r) for r in rows], merge=True, **params)
+    return sorted((p.pid, p.completion_time) for p in procs), [(int(d["Task"][1:]), d["Start"], d["Finish"]) for d in timeline]
+
+
+def test_srtf_matches_unit_step_simulation():
+    rng = random.Random(2)
+    for _ in range(200):
+        rows = random_rows(rng, 12)
+        assert run_merged(CPUScheduler().srtf, rows) == unit_step_srtf(rows)
+
+
+def test_mlfq_matches_unit_step_simulation():
+    rng = random.Random(3)
+    for _ in range(300):
+        rows = random_rows(rng, 12)
+        quanta = tuple(rng.randint(1, 4) for _ in range(rng.randint(1, 3)))
+        boost = rng.choice([None, 5, 9])
+        assert (run_merged(CPUScheduler().mlfq, rows, quanta=quanta, boost=boost)
+                == unit_step_mlfq(rows, quanta, boost))
+
+
+def test_from_buffers_rejects_non_integer_columns():
+    for bad in (array("d", [1.0, 2.0]), array("Q", [1, 2]), array("i", [1, 2])):
+        with pytest.raises(ValueError):
+            ProcessTable.from_buffers(bad, array("q", [0, 1]), array("q", [3, 4]))
+
+
+def test_from_buffers_copies_strided_views():
+    values = array("q", range(10))
+    table = ProcessTable.from_buffers(memoryview(values)[::2], memoryview(values)[1::2], values[5:])
+    assert list(table.pid) == [0, 2, 4, 6, 8]
+    assert list(table.arrival_time) == [1, 3, 5, 7, 9]
+    assert list(table.burst_time) == [5, 6, 7, 8, 9]
+
+
+def test_fcfs_vectorized_matches_fcfs():
+    pytest.importorskip("numpy")
+    rng = random.Random(4)
+    for _ in range(300):
+        # Arrivals spread wide enough for idle gaps between bursts.
+        rows = [(k + 1, rng.randint(0, 120), rng.randint(1, 6)) for k in range(rng.randint(0, 30))]
+        expected, timeline = CPUScheduler().fcfs([Process(*r) for r in rows])
+        expected = [(p.pid, p.start_time, p.completion_time, p.waiting_time, p.turnaround_time) for p in expected]
+
+        procs = [Process(*r) for r in rows]
+        result, (pid, start, finish) = CPUScheduler().fcfs_vectorized(procs)
+        assert [(p.pid, p.start_time, p.completion_time, p.waiting_time, p.turnaround_time) for p in result] == expected
+        assert sorted(result, key=id) == sorted(procs, key=id)
+        assert list(zip(pid.tolist(), start.tolist(), finish.tolist())) == [
+            (int(d["Task"][1:]), d["Start"], d["Finish"]) for d in timeline]
+
+        table, _ = CPUScheduler().fcfs_vectorized(as_table(rows))
+        assert list(zip(table.pid, table.start_time, table.completion_time,
+                        table.waiting_time, table.turnaround_time)) == expected
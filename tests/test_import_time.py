@@ -0,0 +1,16 @@
+import compileall
+import os
+
+from benchmarks.import_time import HEAVY, MODULES, ROOT, import_time
+
+# A soft bound: the script's 15 ms budget is for quiet machines, this only catches an
+# import that pulls in something large.
+BUDGET_MS = 200
+
+
+def test_algorithms_import_with_the_standard_library_only():
+    compileall.compile_dir(os.path.join(ROOT, "algorithms"), quiet=1)
+    for module in MODULES:
+        ms, loaded = import_time(module)
+        assert not loaded.intersection(HEAVY), module
+        assert ms is not None and ms < BUDGET_MS, module
@@ -0,0 +1,315 @@
+import io
+import random
+from array import array
+
+import pytest
+
+from algorithms.memory import MemoryManager, PageTrace, ResidentTrace, TraceFile
+
+
+def random_pages(rng, max_n=80):
+    return [rng.randint(0, rng.randint(1, 12)) for _ in range(rng.randint(0, max_n))]
+
+
+def baseline_lru(pages, frames_count):
+    # The original list LRU (most recently used last), also reporting each eviction.
+    frames = []
+    page_faults = 0
+    snapshots = []
+    victims = []
+    for page in pages:
+        status = "Hit"
+        if page not in frames:
+            status = "Miss"
+            page_faults += 1
+            if len(frames) == frames_count:
+                victims.append(frames.pop(0))
+            frames.append(page)
+        else:
+            frames.remove(page)
+            frames.append(page)
+        snapshots.append({"Page": page, "Frames": list(frames), "Status": status})
+    return page_faults, snapshots, victims
+
+
+def test_lru_matches_list_lru():
+    rng = random.Random(11)
+    for _ in range(500):
+        pages = random_pages(rng)
+        frames = rng.randint(1, 6)
+        faults, snapshots, victims = baseline_lru(pages, frames)
+        assert MemoryManager().lru(pages, frames) == (faults, snapshots)
+
+        trace = PageTrace(frames, interval=rng.randint(1, 8))
+        assert MemoryManager().lru(pages, frames, snapshots=False, trace=trace)[0] == faults
+        assert [v for v in trace.evicted if v != -1] == victims
+        assert [trace.status(k) for k in range(len(trace))] == [s["Status"] for s in snapshots]
+
+
+def test_lru_fault_curve_matches_lru_per_frame_count():
+    rng = random.Random(14)
+    manager = MemoryManager()
+    for _ in range(200):
+        pages = random_pages(rng)
+        curve = manager.lru_fault_curve(pages)
+        assert len(curve) == len(set(pages))
+        assert curve == [manager.lru(pages, k, snapshots=False)[0] for k in range(1, len(curve) + 1)]
+        # Past the number of distinct pages only compulsory misses remain.
+        extra = len(curve) + 3
+        assert manager.lru_fault_curve(pages, extra)[len(curve):] == [len(set(pages))] * 3
+
+
+def naive_opt_faults(pages, frames_count):
+    # Belady's rule with a linear look-ahead on every eviction: replace the resident page
+    # whose next use is farthest away (or that is never used again). Ties between pages
+    # never used again may be broken either way; the fault count does not depend on it.
+    frames = []
+    page_faults = 0
+    for t, page in enumerate(pages):
+        if page in frames:
+            continue
+        page_faults += 1
+        if len(frames) == frames_count:
+            future = pages[t + 1:]
+            victim = max(frames, key=lambda p: future.index(p) if p in future else len(future))
+            frames.remove(victim)
+        frames.append(page)
+    return page_faults
+
+
+def test_opt_matches_naive_look_ahead():
+    rng = random.Random(15)
+    manager = MemoryManager()
+    for _ in range(500):
+        pages = random_pages(rng)
+        frames = rng.randint(1, 6)
+        faults = naive_opt_faults(pages, frames)
+        assert manager.opt(pages, frames)[0] == faults
+        assert manager.opt(pages, frames, snapshots=False, trace=PageTrace(frames))[0] == faults
+        # No policy can beat OPT.
+        assert faults <= manager.lru(pages, frames, snapshots=False)[0]
+
+
+def list_clock(pages, frames_count):
+    # Slots as [page, referenced] pairs and a hand that sweeps them in order.
+    slots = []
+    hand = 0
+    page_faults = 0
+    snapshots = []
+    for page in pages:
+        resident = [s[0] for s in slots]
+        if page in resident:
+            slots[resident.index(page)][1] = 1
+        else:
+            page_faults += 1
+            if len(slots) < frames_count:
+                slots.append([page, 1])
+            else:
+                while slots[hand][1]:
+                    slots[hand][1] = 0
+                    hand = (hand + 1) % frames_count
+                slots[hand] = [page, 1]
+                hand = (hand + 1) % frames_count
+        snapshots.append([s[0] for s in slots])
+    return page_faults, snapshots
+
+
+def list_lfu(pages, frames_count):
+    # Evicts the least frequently used page, the least recently used one on ties; an
+    # evicted page's count starts over.
+    frames = []
+    count = {}
+    last_use = {}
+    page_faults = 0
+    snapshots = []
+    for t, page in enumerate(pages):
+        if page not in frames:
+            page_faults += 1
+            if len(frames) == frames_count:
+                victim = min(frames, key=lambda p: (count[p], last_use[p]))
+                frames.remove(victim)
+                del count[victim]
+            frames.append(page)
+        count[page] = count.get(page, 0) + 1
+        last_use[page] = t
+        snapshots.append(sorted(frames))
+    return page_faults, snapshots
+
+
+def list_arc(pages, c):
+    # ARC as written in the paper's pseudocode, with lists ordered LRU first; p moves by
+    # whole pages, as in MemoryManager.arc.
+    t1, t2, b1, b2 = [], [], [], []
+    p = 0
+    page_faults = 0
+    snapshots = []
+
+    def replace(in_b2):
+        if t1 and (len(t1) > p or (in_b2 and len(t1) == p)):
+            b1.append(t1.pop(0))
+        else:
+            b2.append(t2.pop(0))
+
+    for page in pages:
+        if page in t1 or page in t2:
+            (t1 if page in t1 else t2).remove(page)
+            t2.append(page)
+        else:
+            page_faults += 1
+            if page in b1:
+                p = min(c, p + max(len(b2) // len(b1), 1))
+                replace(False)
+                b1.remove(page)
+                t2.append(page)
+            elif page in b2:
+                p = max(0, p - max(len(b1) // len(b2), 1))
+                replace(True)
+                b2.remove(page)
+                t2.append(page)
+            else:
+                if len(t1) + len(b1) == c:
+                    if len(t1) < c:
+                        b1.pop(0)
+                        replace(False)
+                    else:
+                        t1.pop(0)
+                elif len(t1) + len(t2) + len(b1) + len(b2) >= c:
+                    if len(t1) + len(t2) + len(b1) + len(b2) == 2 * c:
+                        b2.pop(0)
+                    replace(False)
+                t1.append(page)
+        snapshots.append(t1 + t2)
+    return page_faults, snapshots
+
+
+def list_two_q(pages, frames_count):
+    # Full 2Q as in the paper: a hit in Am refreshes it, a page remembered in A1out goes to
+    # Am, a hit in A1in changes nothing, and any other page enters A1in. reclaimfor() pages
+    # out A1in's oldest page (remembering it in A1out) while A1in holds more than Kin, and
+    # Am's least recently used page otherwise (or A1in's oldest when Am is empty).
+    k_in = max(1, frames_count // 4)
+    k_out = max(1, frames_count // 2)
+    a1in, a1out, am = [], [], []
+    page_faults = 0
+    snapshots = []
+
+    def reclaim():
+        if len(a1in) + len(am) < frames_count:
+            return
+        if len(a1in) > k_in or not am:
+            a1out.append(a1in.pop(0))
+            if len(a1out) > k_out:
+                a1out.pop(0)
+        else:
+            am.pop(0)
+
+    for page in pages:
+        if page in am:
+            am.remove(page)
+            am.append(page)
+        elif page in a1in:
+            pass
+        elif page in a1out:
+            page_faults += 1
+            a1out.remove(page)
+            reclaim()
+            am.append(page)
+        else:
+            page_faults += 1
+            reclaim()
+            a1in.append(page)
+        snapshots.append(a1in + am)
+    return page_faults, snapshots
+
+
+def test_policies_match_list_references():
+    rng = random.Random(16)
+    manager = MemoryManager()
+    references = {"clock": list_clock, "lfu": list_lfu, "arc": list_arc, "two_q": list_two_q}
+    for _ in range(1000):
+        pages = random_pages(rng)
+        frames = rng.randint(1, 8)
+        for name, reference in references.items():
+            faults, snapshots = reference(pages, frames)
+            result, history = getattr(manager, name)(pages, frames)
+            resident = [h["Frames"] for h in history]
+            if name == "lfu":
+                resident = [sorted(r) for r in resident]
+            assert (name, result, resident) == (name, faults, snapshots)
+            trace = PageTrace(frames, interval=rng.randint(1, 8))
+            assert getattr(manager, name)(pages, frames, snapshots=False, trace=trace)[0] == faults
+
+
+def random_trace_text(rng, pages):
+    # Commas, spaces, tabs and newlines in any mix, with separators at either end at times.
+    seps = [",", " ", ", ", "\t", "\n", " ,\n", "  "]
+    text = "".join(f"{page}{rng.choice(seps)}" for page in pages)
+    return rng.choice(["", " ", "\n"]) + (text if rng.random() < 0.5 else text.rstrip(",\t\n "))
+
+
+def test_text_trace_parses_tokens_split_across_blocks(tmp_path):
+    rng = random.Random(17)
+    path = tmp_path / "trace.txt"
+    for _ in range(300):
+        pages = [rng.randrange(rng.choice([10, 1000, 10 ** 9])) for _ in range(rng.randint(0, 40))]
+        text = random_trace_text(rng, pages)
+        path.write_text(text)
+        chunk_size = rng.randint(1, 16)
+        for source in (str(path), io.BytesIO(text.encode()), io.StringIO(text)):
+            with TraceFile(source, chunk_size=chunk_size) as trace:
+                assert list(trace) == pages
+                assert len(trace) == len(pages)
+
+
+def test_raw_trace_round_trip(tmp_path):
+    rng = random.Random(18)
+    for fmt, code in (("int32", "i"), ("int64", "q")):
+        pages = array(code, [rng.randrange(2 ** 31) for _ in range(100)])
+        path = tmp_path / f"trace.{fmt}"
+        path.write_bytes(pages.tobytes())
+        with open(path, "rb") as f:
+            for source in (str(path), f, io.BytesIO(pages.tobytes())):
+                with TraceFile(source, fmt, chunk_size=rng.randint(1, 16)) as trace:
+                    assert list(trace) == list(pages)
+
+
+def test_raw_trace_size_must_be_a_multiple_of_the_width(tmp_path):
+    path = tmp_path / "trace.bin"
+    path.write_bytes(bytes(6))
+    for fmt in ("int32", "int64"):
+        with pytest.raises(ValueError):
+            TraceFile(str(path), fmt)
+        with pytest.raises(ValueError):
+            TraceFile(io.BytesIO(bytes(6)), fmt)
+
+
+def test_resident_trace_rebuilds_pff_history():
+    rng = random.Random(19)
+    manager = MemoryManager()
+    for _ in range(300):
+        # Wide page ranges and long thresholds grow resident sets past the checkpoint interval.
+        pages = [rng.randrange(rng.choice([4, 12, 40])) for _ in range(rng.randint(0, 120))]
+        threshold = rng.randint(1, 20)
+        faults, history = manager.pff(pages, threshold)
+        trace = ResidentTrace(interval=rng.randint(1, 8))
+        assert manager.pff(pages, threshold, snapshots=False, trace=trace)[0] == faults == trace.faults
+        assert len(trace) == len(pages)
+
+        for k, h in enumerate(history):
+            assert trace.frames_at(k) == h["Frames"]
+            assert trace.status(k) == h["Status"]
+        for start in {0, len(pages) // 2, len(pages) - 1} if pages else ():
+            limit = rng.randint(1, 6)
+            rows = list(trace.rows(start, max_frames=limit))
+            assert rows == [(k, h["Page"], h["Status"], h["Frames"][:limit])
+                            for k, h in enumerate(history) if k >= start]
+
+
+def test_working_set_sizes_match_window_scan():
+    rng = random.Random(20)
+    manager = MemoryManager()
+    for _ in range(300):
+        pages = random_pages(rng)
+        tau = rng.randint(1, 12)
+        expected = [len(set(pages[max(0, t - tau + 1):t + 1])) for t in range(len(pages))]
+        assert list(manager.working_set_sizes(pages, tau)) == expected
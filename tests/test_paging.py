@@ -0,0 +1,41 @@
+import random
+
+from algorithms.memory import MemoryManager
+from algorithms.paging import PagingSystem
+
+
+def random_trace(rng, max_n=80):
+    processes = rng.randint(1, 4)
+    n = rng.randint(0, max_n)
+    return [rng.randrange(processes) for _ in range(n)], [rng.randint(0, 8) for _ in range(n)]
+
+
+def test_global_faults_match_memory_manager():
+    # Whatever the TLB caches, the frames hold what one LRU or FIFO over (pid, page) keys holds.
+    rng = random.Random(20)
+    manager = MemoryManager()
+    for _ in range(500):
+        pids, pages = random_trace(rng)
+        keys = [pid * 100 + page for pid, page in zip(pids, pages)]
+        frames = rng.randint(1, 8)
+        algorithm = rng.choice(PagingSystem.algorithms)
+        paging = PagingSystem(frames, tlb_size=rng.randint(0, 6), algorithm=algorithm)
+        _, stats = paging.run(pids, pages)
+        assert stats["Page Faults"] == getattr(manager, algorithm)(keys, frames, snapshots=False)[0]
+
+
+def test_local_faults_match_single_process_runs():
+    rng = random.Random(21)
+    manager = MemoryManager()
+    for _ in range(500):
+        pids, pages = random_trace(rng)
+        processes = sorted(set(pids))
+        quotas = {pid: rng.randint(1, 4) for pid in processes}
+        algorithm = rng.choice(PagingSystem.algorithms)
+        paging = PagingSystem(sum(quotas.values()) + rng.randint(1, 2), tlb_size=rng.randint(0, 6),
+                              scope="local", algorithm=algorithm)
+        rows, _ = paging.run(pids, pages, quotas)
+        assert [row["PID"] for row in rows] == processes
+        for row in rows:
+            own = [page for pid, page in zip(pids, pages) if pid == row["PID"]]
+            assert row["Faults"] == getattr(manager, algorithm)(own, quotas[row["PID"]], snapshots=False)[0]
@@ -0,0 +1,69 @@
+import random
+from collections import defaultdict
+
+from algorithms.cpu import CPUScheduler, Process
+from algorithms.smp import SMPScheduler
+
+ALGORITHMS = ("fcfs", "sjf_non_preemptive", "round_robin")
+
+
+def random_rows(rng, max_n=30):
+    # Few distinct arrivals and bursts, so ties and idle gaps are common.
+    n = rng.randint(0, max_n)
+    return [(k + 1, rng.randint(0, 40), rng.randint(1, 8)) for k in range(n)]
+
+
+def uniprocessor(algo, rows, quantum):
+    scheduler = CPUScheduler()
+    procs = [Process(*r) for r in rows]
+    if algo == "round_robin":
+        procs, _ = scheduler.round_robin(procs, quantum)
+    else:
+        procs, _ = getattr(scheduler, algo)(procs)
+    return sorted((p.pid, p.completion_time) for p in procs)
+
+
+def test_single_core_matches_cpu_scheduler():
+    rng = random.Random(4)
+    for _ in range(300):
+        rows = random_rows(rng)
+        algo = rng.choice(ALGORITHMS)
+        quantum = rng.randint(1, 4)
+        for policy in SMPScheduler.policies:
+            procs, _, _ = SMPScheduler(1, policy).run(algo, [Process(*r) for r in rows], quantum)
+            assert sorted((p.pid, p.completion_time) for p in procs) == uniprocessor(algo, rows, quantum)
+
+
+def overlaps(intervals):
+    intervals = sorted(intervals)
+    return any(b[0] < a[1] for a, b in zip(intervals, intervals[1:]))
+
+
+def test_timeline_is_consistent():
+    rng = random.Random(5)
+    for _ in range(500):
+        rows = random_rows(rng)
+        algo = rng.choice(ALGORITHMS)
+        cores = rng.randint(1, 4)
+        policy = rng.choice(SMPScheduler.policies)
+        procs, (core, pid, start, finish), _ = SMPScheduler(cores, policy).run(
+            algo, [Process(*r) for r in rows], rng.randint(1, 4))
+
+        by_core = defaultdict(list)
+        by_pid = defaultdict(list)
+        for c, p, s, f in zip(core, pid, start, finish):
+            assert 0 <= c < cores and s < f
+            by_core[c].append((s, f))
+            by_pid[p].append((s, f))
+        # No core runs two segments at once, and no process runs on two cores at once.
+        assert not any(overlaps(segments) for segments in by_core.values())
+        assert not any(overlaps(segments) for segments in by_pid.values())
+
+        arrival = {r[0]: r[1] for r in rows}
+        burst = {r[0]: r[2] for r in rows}
+        assert set(by_pid) == set(burst)
+        for p, segments in by_pid.items():
+            assert sum(f - s for s, f in segments) == burst[p]
+            assert min(s for s, _ in segments) >= arrival[p]
+        for p in procs:
+            assert p.completion_time == max(f for _, f in by_pid[p.pid])